@@ -0,0 +1,96 @@
+import csv
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Dict, List
+
+@dataclass
+class BatchJob:
+    term: str
+    max_profiles: int
+    priority: int = 0
+    line: int = 0
+
+    @property
+    def key(self) -> str:
+        return f"{self.term}\0{self.max_profiles}"
+
+def _parse_job(record: dict, line: int) -> BatchJob:
+    term = str(record.get("term") or "").strip()
+    if not term:
+        raise ValueError(f"Job on line {line} has no term")
+    try:
+        max_profiles = int(record.get("max_profiles"))
+        priority = int(record.get("priority") or 0)
+    except (TypeError, ValueError):
+        raise ValueError(f"Job on line {line} needs a numeric max_profiles and priority")
+    if max_profiles <= 0:
+        raise ValueError(f"Job on line {line} must request a positive number of profiles")
+    return BatchJob(term, max_profiles, priority, line)
+
+def _read_records(path: str) -> List[tuple]:
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        if path.lower().endswith(".csv"):
+            return [(index + 2, row) for index, row in enumerate(csv.DictReader(f))]
+
+        records = []
+        for index, text in enumerate(f, 1):
+            if text.strip():
+                try:
+                    records.append((index, json.loads(text)))
+                except ValueError:
+                    raise ValueError(f"Invalid JSON on line {index} of {path}")
+        return records
+
+def load_jobs(path: str) -> List[BatchJob]:
+    jobs = []
+    seen_keys = set()
+    for line, record in _read_records(path):
+        job = _parse_job(record, line)
+        if job.key in seen_keys:
+            print(f"Skipping duplicate job on line {line}: {job.term} ({job.max_profiles})")
+            continue
+        seen_keys.add(job.key)
+        jobs.append(job)
+    return sorted(jobs, key=lambda job: (-job.priority, job.line))
+
+def manifest_path(jobs_path: str) -> str:
+    return f"{os.path.splitext(jobs_path)[0]}.manifest.json"
+
+class BatchManifest:
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self.entries: Dict[str, dict] = {}
+        if os.path.exists(path):
+            try:
+                with open(path, "r") as f:
+                    self.entries = {f"{entry['term']}\0{entry['max_profiles']}": entry for entry in json.load(f)["jobs"]}
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                print(f"Could not read manifest {path}: {str(e)}")
+
+    def is_completed(self, job: BatchJob) -> bool:
+        return self.entries.get(job.key, {}).get("status") == "completed"
+
+    def update(self, job: BatchJob, status: str, **fields) -> None:
+        with self._lock:
+            entry = self.entries.setdefault(job.key, {})
+            entry.update(asdict(job))
+            entry.pop("line")
+            entry.update(fields, status=status, updated_at=datetime.now().isoformat(timespec="seconds"))
+            self.save()
+
+    def save(self) -> None:
+        data = {"jobs": sorted(self.entries.values(), key=lambda entry: (-entry["priority"], entry["term"]))}
+        temporary_path = f"{self.path}.tmp"
+        with open(temporary_path, "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(temporary_path, self.path)
+
+    def summary(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for entry in self.entries.values():
+            counts[entry["status"]] = counts.get(entry["status"], 0) + 1
+        return counts
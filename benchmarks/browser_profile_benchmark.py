@@ -0,0 +1,65 @@
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from selenium.webdriver.common.by import By
+
+from main import BrowserManager
+from standin_server import start_background_server
+
+def standin_urls(base_url, pages):
+    return [f"{base_url}/search/results/people/?keywords=benchmark&page={page}" for page in range(1, pages + 1)]
+
+def benchmark_profile(lean, urls, login_url=None):
+    driver = BrowserManager.create_driver(lean=lean)
+    try:
+        if login_url:
+            driver.get(login_url)
+            driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+
+        page_loads = []
+        started = time.perf_counter()
+        for url in urls:
+            driver.get(url)
+            usage = BrowserManager.get_resource_usage(driver)
+            if usage['page_load_ms']:
+                page_loads.append(usage['page_load_ms'])
+        elapsed = time.perf_counter() - started
+        usage = BrowserManager.get_resource_usage(driver)
+        average_load = sum(page_loads) / len(page_loads) if page_loads else None
+        return usage['peak_rss_mb'], average_load, elapsed / len(urls) * 1000
+    finally:
+        BrowserManager.close_driver(driver)
+
+def main():
+    target_url = sys.argv[1] if len(sys.argv) > 1 else None
+    pages = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    server = None
+    login_url = None
+    if target_url:
+        urls = [target_url] * pages
+    else:
+        server, target_url = start_background_server()
+        login_url = f"{target_url}/login"
+        urls = standin_urls(target_url, pages)
+
+    try:
+        results = {
+            "default": benchmark_profile(False, urls, login_url),
+            "lean": benchmark_profile(True, urls, login_url)
+        }
+    finally:
+        if server:
+            server.shutdown()
+
+    print(f"\nBrowser profile comparison ({pages} page loads of {target_url})")
+    for name, (peak_rss, average_load, wall_ms) in results.items():
+        peak = f"{peak_rss:.0f} MB" if peak_rss else "unavailable"
+        load = f"{average_load:.0f} ms" if average_load else "unavailable"
+        print(f"{name:>8}: peak RSS {peak}, page load {load}, {wall_ms:.0f} ms per navigation")
+
+if __name__ == "__main__":
+    main()
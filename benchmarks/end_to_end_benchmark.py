@@ -0,0 +1,135 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from excel_creator import ExcelCreator
+from fixtures import sample_profiles
+from linkedin_profile_search import LinkedinSearch
+from main import LinkedinScraper, ScrapingConfig
+from profile_batch import ProfileBatch
+from standin_server import start_background_server
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+def benchmark_search(base_url, backend, mode, max_profiles, lean, rate, enrich_tabs, parser_workers):
+    config = ScrapingConfig(
+        search_term="benchmark", max_profiles=max_profiles, extraction_mode=mode, base_url=base_url,
+        lean_browser=lean, ignore_seen_index=True, no_daemon=True, request_rate=rate, pacer_log=None,
+        enrich_tabs=enrich_tabs if backend == "firefox" else 0, parser_workers=parser_workers if mode == "html" else 0,
+        page_backend=backend
+    )
+    scraper = LinkedinScraper(config)
+    try:
+        scraper.initialize_browser()
+        waiter = scraper.create_waiter()
+
+        started = time.perf_counter()
+        if not scraper.login(waiter):
+            raise RuntimeError("Login against the stand-in server failed")
+        login_time = time.perf_counter() - started
+
+        page_finished = [time.perf_counter()]
+        profile_search = scraper.create_search(waiter)
+        profile_search.command_counter.reset()
+        profiles = profile_search.search_profiles(
+            config.search_term, max_profiles,
+            progress_callback=lambda page, count, total: page_finished.append(time.perf_counter())
+        ) or ProfileBatch()
+        elapsed = page_finished[-1] - page_finished[0]
+        if profile_search.enricher:
+            profile_search.enricher.print_summary()
+    finally:
+        scraper.close()
+
+    latencies = [end - start for start, end in zip(page_finished, page_finished[1:])]
+    commands = sum(profile_search.page_command_counts)
+    return {
+        "login": login_time,
+        "profiles": len(profiles),
+        "profiles_per_second": len(profiles) / elapsed if elapsed > 0 else 0.0,
+        "p50": percentile(latencies, 0.5),
+        "p95": percentile(latencies, 0.95),
+        "commands_per_profile": commands / len(profiles) if len(profiles) else 0.0
+    }
+
+def benchmark_export(size):
+    profiles = ProfileBatch()
+    for page in range(1, size // 100 + 2):
+        for profile in sample_profiles(100, page):
+            profiles.append_values(**profile)
+    profiles = profiles[:size]
+
+    with tempfile.TemporaryDirectory() as directory:
+        creator = ExcelCreator(output_directory=directory)
+        started = time.perf_counter()
+        creator.export_profiles(profiles, "benchmark")
+        return time.perf_counter() - started
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end scraper benchmark against the local stand-in server")
+    parser.add_argument("--profiles", type=int, default=100, help="Profiles to collect per extraction mode")
+    parser.add_argument("--modes", nargs="+", default=list(LinkedinSearch.EXTRACTION_MODES),
+                        choices=LinkedinSearch.EXTRACTION_MODES)
+    parser.add_argument("--latency", type=float, default=0.05, help="Server delay per response in seconds")
+    parser.add_argument("--eager-cards", type=int, default=3, help="Cards rendered before the page is scrolled")
+    parser.add_argument("--lazy-delay", type=int, default=200, help="Delay in ms before lazy-loaded cards appear")
+    parser.add_argument("--rate", type=float, default=50.0, help="Pacer rate in navigations per second")
+    parser.add_argument("--enrich", type=int, default=0, help="Tabs used to enrich each page of profiles")
+    parser.add_argument("--parser-workers", type=int, default=0, help="Parser threads for the html mode pipeline")
+    parser.add_argument("--export-sizes", nargs="+", type=int, default=[100, 1_000, 10_000])
+    parser.add_argument("--backends", nargs="+", default=["firefox"], choices=("firefox", "http"),
+                        help="Page backends to compare; http reuses the session saved by the firefox run")
+    parser.add_argument("--lean", action="store_true")
+    args = parser.parse_args()
+
+    os.environ.setdefault("LINKEDIN_EMAIL", "benchmark@example.com")
+    os.environ.setdefault("LINKEDIN_PASSWORD", "benchmark")
+
+    pages = (args.profiles + 9) // 10
+    server, base_url = start_background_server(
+        total_pages=pages, latency=args.latency, eager_cards=args.eager_cards, lazy_delay_ms=args.lazy_delay
+    )
+    working_directory = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            results = {}
+            for backend in args.backends:
+                for mode in args.modes:
+                    if backend != "firefox" and mode == "element":
+                        continue
+                    results[backend, mode] = benchmark_search(
+                        base_url, backend, mode, args.profiles, args.lean, args.rate, args.enrich, args.parser_workers
+                    )
+        finally:
+            os.chdir(working_directory)
+            server.shutdown()
+
+    print(f"\nEnd-to-end search ({args.profiles} profiles over {pages} pages, {args.latency * 1000:.0f} ms server "
+          f"latency, {args.eager_cards} eager cards, {args.lazy_delay} ms lazy delay)")
+    print(f"{'backend':>8} {'mode':>8} {'login':>8} {'profiles/s':>11} {'p50 page':>9} {'p95 page':>9} "
+          f"{'commands/profile':>17}")
+    for (backend, mode), result in results.items():
+        print(
+            f"{backend:>8} {mode:>8} {result['login']:>7.2f}s {result['profiles_per_second']:>11.2f} "
+            f"{result['p50'] * 1000:>7.0f}ms {result['p95'] * 1000:>7.0f}ms {result['commands_per_profile']:>17.1f}"
+        )
+
+    print("\nExcel export")
+    print(f"{'rows':>10} {'export':>9} {'rows/s':>10}")
+    for size in args.export_sizes:
+        elapsed = benchmark_export(size)
+        print(f"{size:>10,} {elapsed:>8.2f}s {size / elapsed:>10,.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pandas as pd
+
+from excel_creator import ExcelCreator
+from fixtures import sample_profiles
+from profile_batch import ProfileBatch
+
+def profile_frame(count, page=1):
+    rows = sample_profiles(count, page)
+    return pd.DataFrame({
+        'Name': [row['name'] for row in rows],
+        'Title': [row['title'] for row in rows],
+        'Location': [row['location'] for row in rows],
+        'Summary': [row['summary'] for row in rows],
+        'Connections': [row['connections'] for row in rows],
+        'Profile Link': [row['profile_link'] for row in rows]
+    })
+
+def profile_batch(count, page=1):
+    batch = ProfileBatch()
+    for profile in sample_profiles(count, page):
+        batch.append_values(**profile)
+    return batch
+
+def rewrite_append(df, filename):
+    if os.path.exists(filename):
+        existing_df = pd.read_excel(filename)
+        df = pd.concat([existing_df, df], ignore_index=True)
+    df.to_excel(filename, index=False)
+
+def timed(operation):
+    started = time.perf_counter()
+    operation()
+    return time.perf_counter() - started
+
+def timed_exports(creator, search_term, batches):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return sum(timed(lambda: creator.export_profiles(batch, search_term)) for batch in batches)
+
+def benchmark_size(existing_rows, batches, batch_size):
+    with tempfile.TemporaryDirectory() as directory:
+        append_creator = ExcelCreator(output_directory=directory)
+        render_creator = ExcelCreator(output_directory=directory, render=True)
+        legacy_file = os.path.join(append_creator.output_directory, "legacy.xlsx")
+
+        existing = profile_frame(existing_rows)
+        existing.to_excel(legacy_file, index=False)
+        existing.to_excel(append_creator._generate_filename("append"), index=False)
+        existing.to_excel(render_creator._generate_filename("render"), index=False)
+        seed = timed(lambda: append_creator._ensure_store(append_creator._generate_filename("append")))
+        render_creator._ensure_store(render_creator._generate_filename("render"))
+
+        legacy_batches = [profile_frame(batch_size, page + 2) for page in range(batches)]
+        legacy = sum(timed(lambda: rewrite_append(batch, legacy_file)) for batch in legacy_batches)
+        new_batches = [profile_batch(batch_size, page + 2) for page in range(batches)]
+        append = timed_exports(append_creator, "append", new_batches)
+        render = timed_exports(render_creator, "render", new_batches)
+
+    return seed, legacy / batches, append / batches, render / batches
+
+def main():
+    sizes = [int(size) for size in sys.argv[1:]] or [10_000, 100_000]
+    batches, batch_size = 5, 10
+
+    print(f"Exporting {batches} batches of {batch_size} rows, full cost of each export_profiles call")
+    print(f"{'existing rows':>14} {'rewrite/export':>15} {'store/export':>13} {'store+render/export':>20} "
+          f"{'one-time seed':>14}")
+    for existing_rows in sizes:
+        seed, legacy, append, render = benchmark_size(existing_rows, batches, batch_size)
+        print(f"{existing_rows:>14,} {legacy:>14.3f}s {append * 1000:>11.2f}ms {render:>19.3f}s {seed:>13.3f}s")
+
+if __name__ == "__main__":
+    main()
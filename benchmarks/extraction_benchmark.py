@@ -0,0 +1,60 @@
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fixtures import render_results_page, sample_profiles
+from linkedin_profile_search import LinkedinSearch
+from main import BrowserManager
+
+def write_fixture_page(directory, profiles_per_page=10):
+    fixture_path = os.path.join(directory, "search_results.html")
+    with open(fixture_path, "w", encoding="utf-8") as f:
+        f.write(render_results_page(sample_profiles(profiles_per_page)))
+    return Path(fixture_path).as_uri()
+
+def benchmark_mode(driver, mode, fixture_url, rounds, profiles_per_page):
+    search = LinkedinSearch(driver, extraction_mode=mode)
+    driver.get(fixture_url)
+    search.command_counter.reset()
+
+    extract = {
+        "batch": search._extract_profiles_batch,
+        "element": search._extract_profiles_by_element,
+        "html": search._extract_profiles_html
+    }[mode]
+
+    durations = []
+    for _ in range(rounds):
+        search._collected_keys.clear()
+        started = time.perf_counter()
+        profiles = extract(profiles_per_page)
+        durations.append(time.perf_counter() - started)
+        if len(profiles) != profiles_per_page:
+            raise RuntimeError(f"{mode} mode extracted {len(profiles)} of {profiles_per_page} profiles")
+
+    commands = search.command_counter.reset() / rounds
+    average = sum(durations) / len(durations)
+    return commands, average
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    profiles_per_page = 10
+    driver = BrowserManager.create_driver()
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            fixture_url = write_fixture_page(directory, profiles_per_page)
+            results = {mode: benchmark_mode(driver, mode, fixture_url, rounds, profiles_per_page)
+                       for mode in LinkedinSearch.EXTRACTION_MODES}
+    finally:
+        BrowserManager.close_driver(driver)
+
+    print(f"\nExtraction benchmark ({profiles_per_page} profiles/page, {rounds} rounds)")
+    for mode, (commands, average) in results.items():
+        print(f"{mode:>8}: {commands:6.1f} driver commands/page, {average * 1000:8.1f} ms/page")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+import json
+from html import escape
+
+def _padding(count):
+    return "<div></div>" * count
+
+def sample_profiles(count=10, page=1, link_base="https://www.linkedin.com"):
+    profiles = []
+    for offset in range(count):
+        number = (page - 1) * count + offset + 1
+        profiles.append({
+            "name": f"Test Person {number}",
+            "title": f"Machine Learning Engineer {number}",
+            "location": "Istanbul, Turkey",
+            "summary": f"Current: Engineer at Company {number}",
+            "connections": f"{number} mutual connections",
+            "profile_link": f"{link_base}/in/test-person-{number}"
+        })
+    return profiles
+
+def render_profile_card(profile):
+    return (
+        f"<div><div><div>{_padding(1)}<div>"
+        "<div>"
+        "<div><div><span><span>"
+        f"<a href=\"{escape(profile['profile_link'])}\"><span><span>{escape(profile['name'])}</span>"
+        "<span>View profile</span></span></a>"
+        "</span></span></div></div>"
+        f"<div>{escape(profile['title'])}</div>"
+        f"<div>{escape(profile['location'])}</div>"
+        "</div>"
+        f"<div><div>{_padding(1)}<div><span>{escape(profile['connections'])}</span></div></div></div>"
+        f"<p>{escape(profile['summary'])}</p>"
+        "</div></div></div></div>"
+    )
+
+def _render_detail_section(section_id, title, entries):
+    items = "".join(
+        "<li class=\"artdeco-list__item\"><div>"
+        + "".join(f"<span aria-hidden=\"true\">{escape(text)}</span>" for text in entry)
+        + "</div></li>"
+        for entry in entries
+    )
+    return f"<section><div id=\"{section_id}\"></div><h2>{title}</h2><ul>{items}</ul></section>"
+
+def render_profile_page(slug):
+    number = slug.rsplit("-", 1)[-1]
+    experience = [
+        (f"Machine Learning Engineer {number}", f"Company {number}", "2021 - Present"),
+        ("Software Engineer", f"Startup {number}", "2018 - 2021")
+    ]
+    education = [(f"University {number}", "MSc Computer Science", "2016 - 2018")]
+    return (
+        f"<html><head><title>{escape(slug)}</title></head><body><main>"
+        + _render_detail_section("experience", "Experience", experience)
+        + _render_detail_section("education", "Education", education)
+        + "</main></body></html>"
+    )
+
+def render_pagination(page, has_next):
+    disabled = "" if has_next else " disabled"
+    return (
+        "<div class=\"artdeco-pagination\">"
+        f"<span class=\"artdeco-pagination__state\">Page {page}</span>"
+        f"<button aria-label=\"Next\" class=\"artdeco-pagination__button--next\"{disabled}>Next</button>"
+        "</div>"
+    )
+
+def render_results_list(profiles, page=1, has_next=True):
+    cards = "".join(f"<li>{render_profile_card(profile)}</li>" for profile in profiles)
+    return (
+        "<main><div><div class=\"search-results-container\">"
+        f"{_padding(1)}<div><div><ul>{cards}</ul></div>{render_pagination(page, has_next)}</div>"
+        "</div></div></main>"
+    )
+
+def render_lazy_script(profiles, delay_ms=0):
+    cards = json.dumps([render_profile_card(profile) for profile in profiles]).replace("</", "<\\/")
+    return (
+        "<style>body { min-height: 3000px; }</style><script>"
+        f"const lazyCards = {cards};"
+        "let lazyRequested = false;"
+        "function loadLazyCards() {"
+        "  if (lazyRequested) { return; }"
+        "  lazyRequested = true;"
+        "  setTimeout(() => {"
+        "    const list = document.querySelector('.search-results-container ul');"
+        "    lazyCards.forEach((html) => { const item = document.createElement('li'); item.innerHTML = html; list.appendChild(item); });"
+        f"  }}, {int(delay_ms)});"
+        "}"
+        "window.addEventListener('scroll', () => {"
+        "  if (window.scrollY + window.innerHeight >= document.body.scrollHeight / 2) { loadLazyCards(); }"
+        "});"
+        "</script>"
+    )
+
+def render_results_page(profiles, page=1, has_next=True, next_href=None, lazy_profiles=(), lazy_delay_ms=0):
+    results = render_results_list(profiles, page, has_next)
+    layout = (
+        f"{_padding(5)}<div>{_padding(2)}<div>{_padding(1)}<div>"
+        f"<div><div>{results}</div></div>"
+        "</div></div></div>"
+    )
+    script = ""
+    if next_href:
+        script = (
+            "<script>document.querySelector(\"button[aria-label='Next']\")"
+            f".addEventListener('click', () => {{ window.location.href = '{next_href}'; }});</script>"
+        )
+    if lazy_profiles:
+        script += render_lazy_script(lazy_profiles, lazy_delay_ms)
+    return (
+        "<!DOCTYPE html><html><head><meta charset=\"utf-8\"><title>Search results</title></head>"
+        f"<body>{layout}{script}</body></html>"
+    )
@@ -0,0 +1,33 @@
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fixtures import render_results_page, sample_profiles
+from html_profile_parser import HtmlProfileParser
+from linkedin_profile_search import LinkedinSearch
+
+def main():
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    profiles_per_page = 10
+    page_source = render_results_page(sample_profiles(profiles_per_page))
+    parser = HtmlProfileParser(LinkedinSearch.CARD_FIELDS)
+    chains = LinkedinSearch.SELECTOR_CHAINS
+
+    cards = parser.parse_cards(page_source, chains, "https://www.linkedin.com/search/results/people/",
+                               profiles_per_page)["cards"]
+    missing = [index for index, card in enumerate(cards, start=1) if card["name"] is None]
+    if missing or len(cards) != profiles_per_page:
+        raise RuntimeError(f"Fixture cards could not be parsed: {missing or len(cards)}")
+
+    started = time.perf_counter()
+    for _ in range(pages):
+        parser.parse_cards(page_source, chains, "https://www.linkedin.com/search/results/people/", profiles_per_page)
+    elapsed = time.perf_counter() - started
+
+    print(f"Parsed {pages} pages ({pages * profiles_per_page} profiles) in {elapsed:.2f}s")
+    print(f"{pages / elapsed:.1f} pages/sec, {elapsed / pages * 1000:.2f} ms/page")
+
+if __name__ == "__main__":
+    main()
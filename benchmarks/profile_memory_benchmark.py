@@ -0,0 +1,57 @@
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from excel_creator import ExcelCreator
+from fixtures import sample_profiles
+from profile_batch import LinkedinProfile, ProfileBatch
+
+class DictProfile:
+    def __init__(self, name="", title="", location="", summary="", connections="", profile_link=""):
+        self.name = name
+        self.title = title
+        self.location = location
+        self.summary = summary
+        self.connections = connections
+        self.profile_link = profile_link
+
+def profile_rows(count):
+    return [tuple(row[field] for field in ProfileBatch.FIELDS) for row in sample_profiles(count)]
+
+def object_list(creator, profile_class, rows):
+    profiles = [profile_class(*row) for row in rows]
+    return profiles, creator._create_dataframe(profiles)
+
+def columnar_batch(creator, rows):
+    batch = ProfileBatch()
+    for row in rows:
+        batch.append_values(**dict(zip(ProfileBatch.FIELDS, row)))
+    return batch, creator._create_dataframe(batch)
+
+def measure(name, build, rows):
+    tracemalloc.start()
+    started = time.perf_counter()
+    container, dataframe = build(rows)
+    elapsed = time.perf_counter() - started
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:>24}: peak {peak / 1024 / 1024:7.1f} MB, retained {current / 1024 / 1024:7.1f} MB, {elapsed:.2f}s")
+    del container, dataframe
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rows = profile_rows(count)
+    print(f"Building {count:,} profiles and their export DataFrame")
+    with tempfile.TemporaryDirectory() as directory:
+        creator = ExcelCreator(output_directory=directory)
+        columnar_batch(creator, rows[:10])
+        measure("__dict__ objects", lambda data: object_list(creator, DictProfile, data), rows)
+        measure("__slots__ objects", lambda data: object_list(creator, LinkedinProfile, data), rows)
+        measure("columnar ProfileBatch", lambda data: columnar_batch(creator, data), rows)
+
+if __name__ == "__main__":
+    main()
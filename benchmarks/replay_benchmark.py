@@ -0,0 +1,77 @@
+import argparse
+import cProfile
+import pstats
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fixtures import render_results_page, sample_profiles
+from linkedin_profile_search import LinkedinSearch
+from page_recorder import PageRecorder, load_recording
+from replay_driver import replay_recording
+
+def record_fixture_pages(directory, pages, profiles_per_page=10):
+    base_url = "https://www.linkedin.com"
+    recorder = PageRecorder(directory, search_term="benchmark", base_url=base_url, extraction_mode="html",
+                            selectors=LinkedinSearch.SELECTOR_CHAINS)
+    for page in range(1, pages + 1):
+        page_url = f"{base_url}/search/results/people/?keywords=benchmark&page={page}"
+        recorder.record(page, render_results_page(sample_profiles(profiles_per_page, page)), page_url)
+        recorder.record_profiles(page, profiles_per_page)
+    return recorder.recording
+
+def run_mode(recording, mode, repeat, profile):
+    profiler = cProfile.Profile() if profile else None
+    results = []
+    for _ in range(repeat):
+        if profiler:
+            profiler.enable()
+        results.append(replay_recording(recording, mode))
+        if profiler:
+            profiler.disable()
+    if profiler:
+        print(f"\nProfile of {mode} mode replay:")
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(15)
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded results pages through the extraction code")
+    parser.add_argument("recording", nargs="?", help="Run file written by --record (recordings/runs/<id>.json)")
+    parser.add_argument("--pages", type=int, default=1000, help="Fixture pages to record when no recording is given")
+    parser.add_argument("--modes", nargs="+", default=["html", "element"], choices=LinkedinSearch.EXTRACTION_MODES)
+    parser.add_argument("--repeat", type=int, default=1, help="Replays per mode")
+    parser.add_argument("--profile", action="store_true", help="Print the hottest functions of each replay")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        if args.recording:
+            recording = load_recording(args.recording)
+        else:
+            recording = record_fixture_pages(directory, args.pages)
+        print(f"Replaying {len(recording.pages)} pages recorded at {recording.started_at} "
+              f"for '{recording.search_term}'")
+
+        failed = False
+        print(f"\n{'mode':>8} {'pages/s':>10} {'ms/page':>9} {'profiles':>9} {'commands/page':>14} {'regressions':>12}")
+        for mode in args.modes:
+            for result in run_mode(recording, mode, args.repeat, args.profile):
+                pages = len(result.pages)
+                elapsed = max(result.elapsed, 1e-9)
+                commands = sum(page.commands for page in result.pages)
+                print(
+                    f"{result.extraction_mode:>8} {pages / elapsed:>10,.0f} {elapsed / max(pages, 1) * 1000:>9.2f} "
+                    f"{len(result.profiles):>9} {commands / max(pages, 1):>14.1f} {len(result.regressions):>12}"
+                )
+                for page in result.regressions:
+                    failed = True
+                    print(f"  page {page.page}: {page.replayed_profiles} profiles, "
+                          f"{page.recorded_profiles} in the recording")
+
+    if failed:
+        print("\nSelector regressions found: some pages yield fewer profiles than when they were recorded")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+import argparse
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlparse
+
+from fixtures import render_profile_page, render_results_page, sample_profiles
+
+SESSION_COOKIE = "li_at=standin-session"
+
+LOGIN_PAGE = (
+    "<!DOCTYPE html><html><head><meta charset=\"utf-8\"><title>Login</title></head><body>"
+    "<form method=\"post\" action=\"/login\">"
+    "<input id=\"username\" name=\"session_key\"><input id=\"password\" name=\"session_password\" type=\"password\">"
+    "<button type=\"submit\">Sign in</button>"
+    "</form></body></html>"
+)
+
+SIMPLE_PAGE = "<!DOCTYPE html><html><head><meta charset=\"utf-8\"><title>{title}</title></head><body>{title}</body></html>"
+
+class StandinRequestHandler(BaseHTTPRequestHandler):
+    server_version = "LinkedinStandin/1.0"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _is_logged_in(self):
+        return SESSION_COOKIE in (self.headers.get("Cookie") or "")
+
+    def _send_html(self, body, status=200, content_type="text/html; charset=utf-8"):
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _redirect(self, location, set_cookie=None):
+        self.send_response(302)
+        self.send_header("Location", location)
+        if set_cookie:
+            self.send_header("Set-Cookie", f"{set_cookie}; Path=/")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _results_page(self, query):
+        keywords = query.get("keywords", [""])[0]
+        page = max(int(query.get("page", ["1"])[0] or 1), 1)
+        if page > self.server.total_pages:
+            return self._send_html(render_results_page([], page, has_next=False))
+
+        has_next = page < self.server.total_pages
+        next_href = f"/search/results/people/?{urlencode({'keywords': keywords, 'page': page + 1})}" if has_next else None
+        profiles = sample_profiles(self.server.profiles_per_page, page, link_base=f"http://{self.headers.get('Host')}")
+        eager_cards = self.server.eager_cards
+        if eager_cards is None:
+            eager_cards = len(profiles)
+        self._send_html(render_results_page(
+            profiles[:eager_cards], page, has_next=has_next, next_href=next_href,
+            lazy_profiles=profiles[eager_cards:], lazy_delay_ms=self.server.lazy_delay_ms
+        ))
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == "/login":
+            return self._send_html(LOGIN_PAGE)
+        if url.path == "/robots.txt":
+            return self._send_html("User-agent: *\nDisallow:\n", content_type="text/plain; charset=utf-8")
+        if url.path == "/":
+            return self._send_html(SIMPLE_PAGE.format(title="Home"))
+        if not self._is_logged_in():
+            return self._redirect("/login")
+        if url.path.rstrip("/") == "/feed":
+            return self._send_html(SIMPLE_PAGE.format(title="Feed"))
+        if url.path.rstrip("/") == "/search/results/people":
+            return self._results_page(parse_qs(url.query))
+        if url.path.startswith("/in/"):
+            return self._send_html(render_profile_page(url.path.strip("/").split("/")[-1]))
+        self._send_html(SIMPLE_PAGE.format(title="Not found"), status=404)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        self.rfile.read(length)
+        if urlparse(self.path).path == "/login":
+            return self._redirect("/feed/", set_cookie=SESSION_COOKIE)
+        self._send_html(SIMPLE_PAGE.format(title="Not found"), status=404)
+
+def create_server(host="127.0.0.1", port=0, total_pages=100, profiles_per_page=10, latency=0.0, verbose=False,
+                  eager_cards=None, lazy_delay_ms=0):
+    server = ThreadingHTTPServer((host, port), StandinRequestHandler)
+    server.total_pages = total_pages
+    server.profiles_per_page = profiles_per_page
+    server.latency = latency
+    server.eager_cards = eager_cards
+    server.lazy_delay_ms = lazy_delay_ms
+    server.verbose = verbose
+    return server
+
+def start_background_server(**kwargs):
+    server = create_server(**kwargs)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address
+    return server, f"http://{host}:{port}"
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the LinkedIn login and people search pages")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--pages", type=int, default=100, help="Number of result pages per search")
+    parser.add_argument("--latency", type=float, default=0.0, help="Artificial delay per page in seconds")
+    parser.add_argument("--eager-cards", type=int, default=None,
+                        help="Cards rendered with the page; the rest are added after the page is scrolled")
+    parser.add_argument("--lazy-delay", type=int, default=0, help="Delay in ms before lazy-loaded cards appear")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    server = create_server(args.host, args.port, args.pages, latency=args.latency, verbose=args.verbose,
+                           eager_cards=args.eager_cards, lazy_delay_ms=args.lazy_delay)
+    print(f"Stand-in server running at http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
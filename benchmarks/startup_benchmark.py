@@ -0,0 +1,150 @@
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+BENCHMARKS = Path(__file__).resolve().parent
+
+GUI_FIRST_PAINT = f"""
+import sys
+sys.path.insert(0, {str(ROOT)!r})
+from PyQt5.QtWidgets import QApplication
+import gui
+app = QApplication(sys.argv)
+gui.apply_dark_theme(app)
+window = gui.MainApplication()
+window.show()
+app.processEvents()
+"""
+
+EXPORT_ONLY = f"""
+import sys
+sys.path.insert(0, {str(ROOT)!r})
+sys.path.insert(0, {str(BENCHMARKS)!r})
+from excel_creator import ExcelCreator
+from fixtures import sample_profiles
+from profile_batch import ProfileBatch
+profiles = ProfileBatch()
+for profile in sample_profiles(100):
+    profiles.append_values(**profile)
+ExcelCreator(output_directory=sys.argv[1]).export_profiles(profiles, "startup")
+"""
+
+HEAVY_MODULES = ("selenium.webdriver", "pandas", "numpy", "openpyxl", "lxml", "PyQt5")
+
+SCENARIOS = {
+    "help": {
+        "args": [str(ROOT / "main.py"), "--help"],
+        "budget_ms": 250,
+        "forbidden": ("selenium.webdriver", "pandas", "numpy", "openpyxl", "lxml", "PyQt5")
+    },
+    "validate": {
+        "args": [str(ROOT / "main.py"), "benchmark", "10", "--extraction-mode", "unknown"],
+        "budget_ms": 250,
+        "forbidden": ("selenium.webdriver", "pandas", "numpy", "openpyxl", "lxml", "PyQt5")
+    },
+    "gui": {
+        "args": ["-c", GUI_FIRST_PAINT],
+        "budget_ms": 1000,
+        "forbidden": ("selenium.webdriver", "pandas", "numpy", "openpyxl", "lxml")
+    },
+    "export": {
+        "args": ["-c", EXPORT_ONLY, "{directory}"],
+        "budget_ms": 2000,
+        "forbidden": ("selenium.webdriver", "PyQt5")
+    }
+}
+
+def parse_importtime(stderr):
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        imports.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return imports
+
+def run_scenario(name, repeat):
+    scenario = SCENARIOS[name]
+    best = None
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as directory:
+            args = [arg.replace("{directory}", directory) for arg in scenario["args"]]
+            env = {**os.environ, "QT_QPA_PLATFORM": "offscreen"}
+            started = time.perf_counter()
+            completed = subprocess.run(
+                [sys.executable, "-X", "importtime", *args], cwd=directory, env=env,
+                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+            )
+            elapsed = time.perf_counter() - started
+        imports = parse_importtime(completed.stderr)
+        result = {
+            "elapsed": elapsed,
+            "imports": imports,
+            "import_ms": sum(cumulative for _, _, cumulative, depth in imports if depth == 0) / 1000,
+            "returncode": completed.returncode,
+            "errors": [line for line in completed.stderr.splitlines() if not line.startswith("import time:")]
+        }
+        if best is None or result["elapsed"] < best["elapsed"]:
+            best = result
+    return best
+
+def loaded_modules(imports, prefixes):
+    names = {name for name, _, _, _ in imports}
+    return [prefix for prefix in prefixes
+            if any(name == prefix or name.startswith(f"{prefix}.") for name in names)]
+
+def print_top_imports(imports, count):
+    top_level = sorted((item for item in imports if item[3] == 0), key=lambda item: item[2], reverse=True)
+    for name, _, cumulative, _ in top_level[:count]:
+        print(f"    {cumulative / 1000:>8.1f} ms  {name}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure CLI, GUI and export startup with python -X importtime")
+    parser.add_argument("--scenarios", nargs="+", default=list(SCENARIOS), choices=list(SCENARIOS))
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per scenario, the fastest one is reported")
+    parser.add_argument("--budget", action="append", default=[], metavar="NAME=MS",
+                        help="Override a scenario's wall-clock budget, e.g. --budget gui=1200")
+    parser.add_argument("--top", type=int, default=8, help="Slowest top-level imports to list per scenario")
+    args = parser.parse_args()
+
+    for override in args.budget:
+        name, _, value = override.partition("=")
+        if name not in SCENARIOS:
+            parser.error(f"Unknown scenario in --budget: {name}")
+        SCENARIOS[name]["budget_ms"] = float(value)
+
+    failed = False
+    print(f"{'scenario':>10} {'wall ms':>9} {'import ms':>10} {'budget ms':>10} {'heavy modules loaded'}")
+    for name in args.scenarios:
+        scenario = SCENARIOS[name]
+        result = run_scenario(name, args.repeat)
+        wall_ms = result["elapsed"] * 1000
+        heavy = loaded_modules(result["imports"], HEAVY_MODULES)
+        print(f"{name:>10} {wall_ms:>9.1f} {result['import_ms']:>10.1f} {scenario['budget_ms']:>10.0f} "
+              f"{', '.join(heavy) or '-'}")
+        print_top_imports(result["imports"], args.top)
+
+        if result["returncode"]:
+            failed = True
+            print(f"  {name} exited with status {result['returncode']}:")
+            for line in result["errors"][-5:]:
+                print(f"    {line}")
+        if wall_ms > scenario["budget_ms"]:
+            failed = True
+            print(f"  {name} took {wall_ms:.0f} ms, over its {scenario['budget_ms']:.0f} ms budget")
+        forbidden = loaded_modules(result["imports"], scenario["forbidden"])
+        if forbidden:
+            failed = True
+            print(f"  {name} imported {', '.join(forbidden)}, which it should not need")
+
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
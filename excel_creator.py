@@ -1,16 +1,30 @@
-import pandas as pd
+import csv
 import os
-from datetime import datetime
-from typing import List, Optional
+import queue
+import threading
+from typing import Callable, List, Optional, Tuple, TYPE_CHECKING
 import sys
-import openpyxl
-import openpyxl.cell._writer
-import openpyxl.worksheet._writer
-import openpyxl.workbook
-import openpyxl.worksheet._write_only
+from profile_batch import ProfileBatch
+from run_metrics import RunMetrics
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 class ExcelCreator:
-    def __init__(self, output_directory="exports"):
+    COLUMNS = ['Name', 'Title', 'Location', 'Summary', 'Connections', 'Profile Link']
+    FIELD_COLUMNS = {
+        'name': 'Name',
+        'title': 'Title',
+        'location': 'Location',
+        'summary': 'Summary',
+        'connections': 'Connections',
+        'profile_link': 'Profile Link'
+    }
+    STORE_DIRECTORY = ".store"
+    STREAM_QUEUE_SIZE = 8
+    STREAM_BATCH_ROWS = 500
+
+    def __init__(self, output_directory="exports", seen_index=None, metrics=None, extra_columns=None, render=False):
         if getattr(sys, 'frozen', False):
             base_path = os.path.dirname(sys.executable)
         else:
@@ -18,6 +32,16 @@ class ExcelCreator:
         
         self.output_directory = os.path.join(base_path, output_directory)
         self._ensure_output_directory()
+        self.seen_index = seen_index
+        self.metrics = metrics or RunMetrics()
+        self.field_columns = {**self.FIELD_COLUMNS, **(extra_columns or {})}
+        self.columns = list(self.field_columns.values())
+        self.render = render
+        self._stream_queue = None
+        self._stream_thread = None
+        self._stream_filename = None
+        self._stream_errors = []
+        self.rows_written = 0
 
     def _ensure_output_directory(self):
         try:
@@ -32,41 +56,24 @@ class ExcelCreator:
             os.makedirs(self.output_directory, exist_ok=True)
             print(f"Fallback directory created at: {self.output_directory}")
 
-    def _save_to_excel(self, df: pd.DataFrame, filename: str) -> None:
-        try:
-            if os.path.exists(filename):
-                try:
-                    existing_df = pd.read_excel(filename)
-                    df = pd.concat([existing_df, df], ignore_index=True)
-                except Exception as e:
-                    print(f"Error reading existing file: {str(e)}")
-                    pass
-            
-            try:
-                df.to_excel(filename, index=False)
-                print(f"Successfully saved data to: {filename}")
-            except PermissionError:
-                base, ext = os.path.splitext(filename)
-                new_filename = f"{base}_{datetime.now().strftime('%Y%m%d_%H%M%S')}{ext}"
-                df.to_excel(new_filename, index=False)
-                print(f"File saved with new name due to permissions: {new_filename}")
-                return
-                
-        except Exception as e:
-            print(f"Error saving Excel file: {str(e)}")
-            try:
-                fallback_path = os.path.join(os.path.expanduser('~'), 'Documents', 'LinkedInExports')
-                os.makedirs(fallback_path, exist_ok=True)
-                fallback_file = os.path.join(fallback_path, os.path.basename(filename))
-                df.to_excel(fallback_file, index=False)
-                print(f"File saved to fallback location: {fallback_file}")
-            except Exception as e2:
-                raise IOError(f"Failed to save file in both locations: {str(e2)}")
-
     def _validate_profiles(self, profiles: List) -> None:
         if not profiles:
             raise ValueError("Profile list is empty")
 
+    def _filter_new_profiles(self, profiles: List) -> List:
+        if self.seen_index is None:
+            return profiles
+        if isinstance(profiles, ProfileBatch):
+            rows = list(profiles)
+            new_rows = {id(profile) for profile in self.seen_index.filter_new(rows)}
+            new_profiles = profiles.take(index for index, profile in enumerate(rows) if id(profile) in new_rows)
+        else:
+            new_profiles = self.seen_index.filter_new(profiles)
+        skipped = len(profiles) - len(new_profiles)
+        if skipped:
+            print(f"Skipped {skipped} profiles that were already exported")
+        return new_profiles
+
     def _extract_profile_data(self, profile) -> dict:
         try:
             return {
@@ -81,7 +88,14 @@ class ExcelCreator:
             print(f"Missing profile data: {str(e)}")
             return None
 
-    def _create_dataframe(self, profiles: List) -> pd.DataFrame:
+    def _create_dataframe(self, profiles: List) -> "pd.DataFrame":
+        if isinstance(profiles, ProfileBatch):
+            if not len(profiles):
+                raise ValueError("No data found for export")
+            return profiles.to_dataframe(self.field_columns)
+
+        import pandas as pd
+
         data = {
             'Name': [],
             'Title': [],
@@ -105,23 +119,117 @@ class ExcelCreator:
     def _generate_filename(self, search_term: str) -> str:
         return f"{self.output_directory}/linkedin_profiles_{search_term.replace(' ', '_')}.xlsx"
 
-    def _save_to_excel(self, df: pd.DataFrame, filename: str) -> None:
+    def _store_path(self, filename: str) -> str:
+        store_directory = os.path.join(os.path.dirname(filename), self.STORE_DIRECTORY)
+        os.makedirs(store_directory, exist_ok=True)
+        return os.path.join(store_directory, f"{os.path.splitext(os.path.basename(filename))[0]}.csv")
+
+    def _read_excel_rows(self, filename: str):
+        import openpyxl
+
+        workbook = openpyxl.load_workbook(filename, read_only=True)
         try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = next(rows, None)
+            if not header:
+                return
+            positions = {name: index for index, name in enumerate(header)}
+            for row in rows:
+                yield ["" if positions.get(column) is None or row[positions[column]] is None
+                       else row[positions[column]] for column in self.columns]
+        finally:
+            workbook.close()
+
+    def _migrate_store(self, store_path: str) -> List[str]:
+        with open(store_path, newline='', encoding='utf-8') as f:
+            rows = csv.reader(f)
+            header = next(rows, None) or []
+            missing = [column for column in self.columns if column not in header]
+            if not missing:
+                return header
+            print(f"Adding columns {', '.join(missing)} to {store_path}")
+            columns = header + missing
+            temporary_path = f"{store_path}.tmp"
+            with open(temporary_path, 'w', newline='', encoding='utf-8') as out:
+                writer = csv.writer(out)
+                writer.writerow(columns)
+                for row in rows:
+                    writer.writerow(row + [""] * (len(columns) - len(row)))
+        os.replace(temporary_path, store_path)
+        return columns
+
+    def _ensure_store(self, filename: str) -> Tuple[str, List[str]]:
+        store_path = self._store_path(filename)
+        if os.path.exists(store_path):
+            return store_path, self._migrate_store(store_path)
+
+        temporary_path = f"{store_path}.tmp"
+        with open(temporary_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(self.columns)
             if os.path.exists(filename):
-                existing_df = pd.read_excel(filename)
-                df = pd.concat([existing_df, df], ignore_index=True)
-            df.to_excel(filename, index=False)
+                print(f"Indexing existing rows of {filename}...")
+                writer.writerows(self._read_excel_rows(filename))
+        os.replace(temporary_path, store_path)
+        return store_path, self.columns
+
+    def _append_rows(self, df: "pd.DataFrame", filename: str) -> None:
+        try:
+            store_path, columns = self._ensure_store(filename)
+            rows = df.reindex(columns=columns, fill_value="")
+            with open(store_path, 'a', newline='', encoding='utf-8') as f:
+                csv.writer(f).writerows(rows.itertuples(index=False, name=None))
+        except PermissionError:
+            raise PermissionError(f"No permission to update export store for: {filename}")
+        except Exception as e:
+            raise IOError(f"Error appending rows for Excel file: {str(e)}")
+
+    def _render_excel(self, filename: str) -> None:
+        try:
+            import openpyxl
+            import openpyxl.cell._writer
+            import openpyxl.worksheet._writer
+            import openpyxl.workbook
+            import openpyxl.worksheet._write_only
+
+            store_path, _ = self._ensure_store(filename)
+            workbook = openpyxl.Workbook(write_only=True)
+            worksheet = workbook.create_sheet()
+            with open(store_path, newline='', encoding='utf-8') as f:
+                for row in csv.reader(f):
+                    worksheet.append(row)
+            workbook.save(filename)
         except PermissionError:
             raise PermissionError(f"No permission to create/update Excel file: {filename}")
         except Exception as e:
             raise IOError(f"Error creating/updating Excel file: {str(e)}")
 
+    def _save_to_excel(self, df: "pd.DataFrame", filename: str) -> str:
+        self._append_rows(df, filename)
+        if not self.render:
+            return self._store_path(filename)
+        self._render_excel(filename)
+        return filename
+
+    def render_excel(self, search_term: str) -> str:
+        filename = self._generate_filename(search_term)
+        self._render_excel(filename)
+        return filename
+
     def export_profiles(self, profiles: List, search_term: str) -> Optional[str]:
+        with self.metrics.span("export"):
+            return self._export_profiles(profiles, search_term)
+
+    def _export_profiles(self, profiles: List, search_term: str) -> Optional[str]:
         try:
             self._validate_profiles(profiles)
+            profiles = self._filter_new_profiles(profiles)
+            if not profiles:
+                print("No new profiles to export")
+                return None
             df = self._create_dataframe(profiles)
-            filename = self._generate_filename(search_term)
-            self._save_to_excel(df, filename)
+            filename = self._save_to_excel(df, self._generate_filename(search_term))
+            self.metrics.increment("rows_exported", len(profiles))
             print(f"\n{len(profiles)} profiles exported to: {filename}")
             return filename
 
@@ -130,4 +238,100 @@ class ExcelCreator:
             return None
         except Exception as e:
             print(f"Unexpected error: {str(e)}")
-            return None
\ No newline at end of file
+            return None
+
+    def open(self, search_term: str) -> str:
+        if self._stream_thread:
+            raise RuntimeError("An export stream is already open")
+
+        self._stream_filename = self._generate_filename(search_term)
+        self._stream_queue = queue.Queue(maxsize=self.STREAM_QUEUE_SIZE)
+        self._stream_errors = []
+        self.rows_written = 0
+        self._stream_thread = threading.Thread(target=self._write_stream, daemon=True)
+        self._stream_thread.start()
+        return self._stream_filename
+
+    def write_batch(self, profiles: List, on_written: Optional[Callable[[int], None]] = None) -> None:
+        if not self._stream_thread:
+            raise RuntimeError("Export stream is not open")
+        if profiles or on_written:
+            self._stream_queue.put((ProfileBatch.from_profiles(profiles), on_written))
+
+    def close(self) -> Optional[str]:
+        if not self._stream_thread:
+            return None
+
+        self._stream_queue.put(None)
+        self._stream_thread.join()
+        self._stream_thread = None
+        self._stream_queue = None
+
+        filename = self._stream_filename if self.render else self._store_path(self._stream_filename)
+        if self.rows_written and self.render:
+            try:
+                with self.metrics.span("export"):
+                    self._render_excel(self._stream_filename)
+            except (PermissionError, IOError) as e:
+                self._stream_errors.append(str(e))
+
+        for error in self._stream_errors:
+            print(f"Error during export: {error}")
+        if not self.rows_written or self._stream_errors:
+            return None
+        print(f"\n{self.rows_written} profiles exported to: {filename}")
+        return filename
+
+    def _next_stream_batches(self) -> list:
+        batches = [self._stream_queue.get()]
+        rows = len(batches[0][0]) if batches[0] else 0
+        while batches[-1] is not None and rows < self.STREAM_BATCH_ROWS:
+            try:
+                batch = self._stream_queue.get_nowait()
+            except queue.Empty:
+                break
+            batches.append(batch)
+            rows += len(batch[0]) if batch else 0
+        return batches
+
+    def _write_stream_batches(self, batches: list) -> None:
+        combined = ProfileBatch()
+        written = []
+        for profiles, on_written in batches:
+            profiles = self._filter_new_profiles(profiles) if profiles else []
+            combined.extend(profiles)
+            written.append((on_written, len(profiles)))
+
+        if len(combined):
+            df = self._create_dataframe(combined)
+            with self.metrics.span("export_append"):
+                self._append_rows(df, self._stream_filename)
+            self.rows_written += len(df)
+            self.metrics.increment("rows_exported", len(df))
+            self.metrics.increment("export_appends")
+        for on_written, rows in written:
+            if on_written:
+                on_written(rows)
+
+    def _write_stream(self) -> None:
+        while True:
+            batches = self._next_stream_batches()
+            closing = batches[-1] is None
+            try:
+                self._write_stream_batches([batch for batch in batches if batch is not None])
+            except Exception as e:
+                self._stream_errors.append(str(e))
+            if closing:
+                return
+
+def main():
+    if len(sys.argv) != 2:
+        raise SystemExit('Usage: python excel_creator.py "search term"')
+    try:
+        filename = ExcelCreator().render_excel(sys.argv[1])
+        print(f"Excel file rendered to: {filename}")
+    except (PermissionError, IOError) as e:
+        print(f"Error during export: {str(e)}")
+
+if __name__ == "__main__":
+    main()
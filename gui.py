@@ -1,11 +1,15 @@
-from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QMessageBox, QStackedWidget
-from PyQt5.QtCore import Qt, QEasingCurve, QPropertyAnimation, QPoint
+from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QMessageBox, QStackedWidget, QCheckBox, QProgressBar
+from PyQt5.QtCore import Qt, QEasingCurve, QPropertyAnimation, QPoint, QThread, pyqtSignal
 from PyQt5.QtGui import QFont, QPalette, QColor
 import sys
 import os
+import threading
+import time
 from dotenv import load_dotenv, set_key
 from pathlib import Path
-from main import LinkedinScraper, ScrapingConfig, BrowserManager
+from main import LinkedinScraper, ScrapingConfig
+from search_checkpoint import load_checkpoint
+from session_daemon import daemon_available, submit_job, unsupported_job_options
 import json
 
 def apply_dark_theme(app):
@@ -221,9 +225,61 @@ class LoginWindow(QWidget):
         except Exception as e:
             QMessageBox.critical(self, 'Error', f'Failed to save credentials: {str(e)}')
 
+class ScrapingWorker(QThread):
+    progress = pyqtSignal(int, int, int, float, float)
+    completed = pyqtSignal(str, int)
+    failed = pyqtSignal(str)
+    submitted_to_daemon = pyqtSignal()
+
+    def __init__(self, config):
+        super().__init__()
+        self.config = config
+        self.cancel_event = threading.Event()
+        self.started_at = None
+        checkpoint = load_checkpoint(config.search_term, config.max_profiles) if config.resume else None
+        self.start_page = checkpoint.next_page if checkpoint else 1
+        self.start_profiles = checkpoint.profile_count if checkpoint else 0
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def _report_progress(self, page, profiles, max_profiles):
+        elapsed = time.perf_counter() - self.started_at
+        pages_per_second = (page - self.start_page + 1) / elapsed if elapsed > 0 else 0.0
+        profiles_per_second = (profiles - self.start_profiles) / elapsed if elapsed > 0 else 0.0
+        remaining = max(max_profiles - profiles, 0)
+        eta = remaining / profiles_per_second if profiles_per_second > 0 else -1.0
+        self.progress.emit(page, profiles, max_profiles, pages_per_second, eta)
+
+    def _use_daemon(self):
+        return (not self.config.no_daemon and not unsupported_job_options(self.config)
+                and not self.cancel_event.is_set() and daemon_available())
+
+    def run(self):
+        self.started_at = time.perf_counter()
+        try:
+            if self._use_daemon():
+                self.submitted_to_daemon.emit()
+                response = submit_job(self.config)
+                if not response or response.get('status') != 'ok':
+                    raise RuntimeError((response or {}).get('error', 'Session daemon did not respond'))
+                self.completed.emit(response.get('excel_file') or '', response.get('profiles', 0))
+                return
+
+            scraper = LinkedinScraper(self.config)
+            try:
+                scraper.initialize_browser()
+                excel_file = scraper.run_scraping(self._report_progress, self.cancel_event)
+            finally:
+                scraper.close()
+            self.completed.emit(excel_file or '', scraper.profile_count)
+        except Exception as e:
+            self.failed.emit(str(e))
+
 class SearchWindow(QWidget):
     def __init__(self):
         super().__init__()
+        self.worker = None
         self.initUI()
 
     def initUI(self):
@@ -250,18 +306,59 @@ class SearchWindow(QWidget):
         count_layout.addWidget(count_label)
         count_layout.addWidget(self.count_input)
 
+        self.lean_checkbox = QCheckBox('Lean browser mode (headless, no images or media)')
+        self.render_checkbox = QCheckBox('Render the Excel file when the search finishes')
+        self.render_checkbox.setChecked(True)
+
         self.search_button = QPushButton('Search')
         self.search_button.setFixedWidth(200)
         self.search_button.clicked.connect(self.start_search)
 
+        self.resume_button = QPushButton('Resume')
+        self.resume_button.setFixedWidth(120)
+        self.resume_button.setToolTip('Continue an interrupted search with the same keyword and profile count')
+        self.resume_button.clicked.connect(self.resume_search)
+
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        button_layout.addWidget(self.search_button)
+        button_layout.addWidget(self.resume_button)
+        button_layout.addStretch()
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+
+        self.status_label = QLabel('')
+        self.status_label.setAlignment(Qt.AlignCenter)
+
+        self.cancel_button = QPushButton('Cancel')
+        self.cancel_button.setFixedWidth(120)
+        self.cancel_button.setToolTip('Stop after the current page; use Resume to continue later')
+        self.cancel_button.setVisible(False)
+        self.cancel_button.clicked.connect(self.cancel_search)
+
+        progress_layout = QHBoxLayout()
+        progress_layout.addWidget(self.progress_bar)
+        progress_layout.addWidget(self.cancel_button)
+
         layout.addLayout(keyword_layout)
         layout.addLayout(count_layout)
-        layout.addWidget(self.search_button, alignment=Qt.AlignCenter)
+        layout.addWidget(self.lean_checkbox)
+        layout.addWidget(self.render_checkbox)
+        layout.addLayout(button_layout)
+        layout.addLayout(progress_layout)
+        layout.addWidget(self.status_label)
         layout.addStretch()
 
         self.setLayout(layout)
 
     def start_search(self):
+        self._run_search(resume=False)
+
+    def resume_search(self):
+        self._run_search(resume=True)
+
+    def _run_search(self, resume):
         keyword = self.keyword_input.text().strip()
         count = self.count_input.text().strip()
 
@@ -274,17 +371,78 @@ class SearchWindow(QWidget):
             if count_int <= 0:
                 raise ValueError('Profile count must be positive')
 
-            config = ScrapingConfig(search_term=keyword, max_profiles=count_int)
-            scraper = LinkedinScraper(config)
-            scraper.initialize_browser()
-            scraper.run_scraping()
-            BrowserManager.close_driver(scraper.driver)
-            QMessageBox.information(self, 'Process Completed', 'Process completed! You can view the data in the exports folder.')
+            if resume and not load_checkpoint(keyword, count_int):
+                QMessageBox.information(self, 'Resume', 'No interrupted search found for this keyword and profile count.')
+                return
 
+            config = ScrapingConfig(
+                search_term=keyword,
+                max_profiles=count_int,
+                lean_browser=self.lean_checkbox.isChecked(),
+                render_excel=self.render_checkbox.isChecked(),
+                resume=resume
+            )
         except ValueError:
             QMessageBox.warning(self, 'Error', 'Please enter a valid positive number for profile count.')
-        except Exception as e:
-            QMessageBox.critical(self, 'Error', f'Failed to start search: {str(e)}')
+            return
+
+        self.worker = ScrapingWorker(config)
+        self.worker.progress.connect(self.update_progress)
+        self.worker.completed.connect(self.search_completed)
+        self.worker.failed.connect(self.search_failed)
+        self.worker.finished.connect(self.search_finished)
+        self.worker.submitted_to_daemon.connect(self.show_daemon_job)
+
+        self.set_running(True, count_int)
+        self.status_label.setText('Starting browser...')
+        self.worker.start()
+
+    def set_running(self, running, max_profiles=0):
+        self.search_button.setEnabled(not running)
+        self.resume_button.setEnabled(not running)
+        self.keyword_input.setEnabled(not running)
+        self.count_input.setEnabled(not running)
+        self.lean_checkbox.setEnabled(not running)
+        self.render_checkbox.setEnabled(not running)
+        self.progress_bar.setVisible(running)
+        self.cancel_button.setVisible(running)
+        self.cancel_button.setEnabled(running)
+        if running:
+            self.progress_bar.setRange(0, max_profiles)
+            self.progress_bar.setValue(0)
+
+    def show_daemon_job(self):
+        self.progress_bar.setRange(0, 0)
+        self.cancel_button.setEnabled(False)
+        self.status_label.setText('Running search in the session daemon...')
+
+    def update_progress(self, page, profiles, max_profiles, pages_per_second, eta):
+        self.progress_bar.setValue(min(profiles, max_profiles))
+        eta_text = f'{eta:.0f}s' if eta >= 0 else 'unknown'
+        self.status_label.setText(
+            f'Page {page}: {profiles}/{max_profiles} profiles ({pages_per_second:.2f} pages/s, ETA {eta_text})'
+        )
+
+    def cancel_search(self):
+        if self.worker:
+            self.worker.cancel()
+            self.cancel_button.setEnabled(False)
+            self.status_label.setText('Cancelling after the current page...')
+
+    def search_completed(self, excel_file, profile_count):
+        if self.worker.cancel_event.is_set():
+            self.status_label.setText(f'Search cancelled after {profile_count} profiles. Use Resume to continue.')
+            return
+        self.status_label.setText(f'Collected {profile_count} profiles.')
+        QMessageBox.information(self, 'Process Completed', 'Process completed! You can view the data in the exports folder.')
+
+    def search_failed(self, error):
+        self.status_label.setText('Search failed.')
+        QMessageBox.critical(self, 'Error', f'Failed to start search: {error}')
+
+    def search_finished(self):
+        self.set_running(False)
+        self.worker = None
 
 class MainApplication(QMainWindow):
     def __init__(self):
@@ -357,6 +515,13 @@ class MainApplication(QMainWindow):
             apply_light_theme(QApplication.instance())
             self.theme_button.setText('🌙 Dark')
 
+    def closeEvent(self, event):
+        worker = getattr(getattr(self, 'search_window', None), 'worker', None)
+        if worker and worker.isRunning():
+            worker.cancel()
+            worker.wait()
+        super().closeEvent(event)
+
     def center(self):
         qr = self.frameGeometry()
         cp = QApplication.desktop().availableGeometry().center()
@@ -0,0 +1,68 @@
+from lxml import etree
+from lxml import html as lxml_html
+from typing import Dict, List, Optional, Sequence
+from urllib.parse import urljoin
+from selector_registry import Selector
+
+class HtmlProfileParser:
+    def __init__(self, fields: Sequence[str]):
+        self.fields = tuple(fields)
+        self._compiled = {}
+
+    def _compile(self, selector: Selector):
+        if selector not in self._compiled:
+            if selector.kind == "css":
+                try:
+                    from lxml.cssselect import CSSSelector
+                    compiled = CSSSelector(selector.expression)
+                except ImportError:
+                    print("cssselect is not installed, CSS selectors are skipped in html mode")
+                    compiled = None
+            else:
+                compiled = etree.XPath(selector.expression)
+            self._compiled[selector] = compiled
+        return self._compiled[selector]
+
+    def find_all(self, context, selector: Selector) -> list:
+        compiled = self._compile(selector)
+        return compiled(context) if compiled is not None else []
+
+    def _lookup(self, context, chain: Sequence[Selector]):
+        for index, selector in enumerate(chain):
+            matches = self.find_all(context, selector)
+            if matches:
+                return matches[0], index
+        return None, -1
+
+    def _text(self, node) -> Optional[str]:
+        if node is None:
+            return None
+        return " ".join(node.text_content().split())
+
+    def _link(self, node, base_url: str) -> Optional[str]:
+        if node is None:
+            return None
+        href = node.get("href") or ""
+        return urljoin(base_url, href) if href else ""
+
+    def parse_cards(self, page_source: str, chains: Dict[str, List[Selector]], base_url: str = "",
+                    profiles_to_extract: int = 10) -> dict:
+        if not page_source:
+            return {"card_hit": -1, "cards": []}
+
+        document = lxml_html.fromstring(page_source).getroottree()
+        bases, card_hit = [], -1
+        for index, selector in enumerate(chains["card"]):
+            bases = self.find_all(document, selector)
+            if bases:
+                card_hit = index
+                break
+
+        cards = []
+        for base in bases[:profiles_to_extract]:
+            card = {"hits": {}}
+            for field in self.fields:
+                node, card["hits"][field] = self._lookup(base, chains[field])
+                card[field] = self._link(node, base_url) if field == "profile_link" else self._text(node)
+            cards.append(card)
+        return {"card_hit": card_hit, "cards": cards}
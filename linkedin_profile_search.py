@@ -1,50 +1,176 @@
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
-from excel_creator import ExcelCreator
-import time
-
-class LinkedinProfile:
-    def __init__(self, name="", title="", location="", summary="", connections="", profile_link=""):
-        self.name = name
-        self.title = title
-        self.location = location
-        self.summary = summary
-        self.connections = connections
-        self.profile_link = profile_link
+from page_waiter import PageWaiter
+from page_backend import SeleniumBackend
+from selector_registry import SelectorRegistry, css, xpath
+from request_pacer import RequestPacer
+from run_metrics import RunMetrics
+from profile_index import normalize_profile_link, profile_key
+from profile_batch import LinkedinProfile, ProfileBatch
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
+
+class DriverCommandCounter:
+    def __init__(self, driver):
+        self.count = 0
+        self._execute = driver.execute
+        driver.execute = self._counting_execute
+
+    @classmethod
+    def attach(cls, driver) -> "DriverCommandCounter":
+        counter = getattr(driver, "_command_counter", None)
+        if counter is None:
+            counter = driver._command_counter = cls(driver)
+        return counter
+
+    def _counting_execute(self, driver_command, params=None):
+        self.count += 1
+        return self._execute(driver_command, params)
+
+    def reset(self):
+        count = self.count
+        self.count = 0
+        return count
 
 class LinkedinSearch:
-    PROFILE_BASE_XPATH = "/html/body/div[6]/div[3]/div[2]/div/div[1]/main/div/div/div[2]/div/ul/li[{index}]/div/div/div/div[2]"
+    RESULT_ITEMS_XPATH = "/html/body/div[6]/div[3]/div[2]/div/div[1]/main/div/div/div[2]/div/ul/li"
+    CARD_CONTENT_XPATH = "div/div/div/div[2]"
     PROFILE_LINK_XPATH = "div[1]/div[1]/div/span[1]/span/a"
     NAME_XPATH = "div[1]/div[1]/div/span[1]/span/a/span/span[1]"
     TITLE_XPATH = "div[1]/div[2]"
     LOCATION_XPATH = "div[1]/div[3]"
     CONNECTIONS_XPATH = "div[2]/div/div[2]/span"
     SUMMARY_XPATH = "p"
-    NEXT_BUTTON_SELECTORS = [
-        "//button[@aria-label='Next']",
-        "//button[contains(@class, 'artdeco-pagination__button--next')]"
-    ]
+    CARD_FIELDS = ("profile_link", "name", "title", "location", "connections", "summary")
+    SELECTOR_CHAINS = {
+        "card": [
+            css("li.reusable-search__result-container"),
+            xpath("//li[.//*[@data-chameleon-result-urn]]", "data"),
+            xpath(RESULT_ITEMS_XPATH)
+        ],
+        "profile_link": [
+            css("span.entity-result__title-text a.app-aware-link"),
+            css("a[data-test-app-aware-link][href*='/in/']", "data"),
+            xpath(f"{CARD_CONTENT_XPATH}/{PROFILE_LINK_XPATH}")
+        ],
+        "name": [
+            css("span.entity-result__title-text a span[aria-hidden='true']"),
+            css("a[data-test-app-aware-link] span[aria-hidden='true']", "data"),
+            xpath(f"{CARD_CONTENT_XPATH}/{NAME_XPATH}")
+        ],
+        "title": [
+            css("div.entity-result__primary-subtitle"),
+            xpath(f"{CARD_CONTENT_XPATH}/{TITLE_XPATH}")
+        ],
+        "location": [
+            css("div.entity-result__secondary-subtitle"),
+            xpath(f"{CARD_CONTENT_XPATH}/{LOCATION_XPATH}")
+        ],
+        "connections": [
+            css("div.entity-result__insights span.entity-result__simple-insight-text"),
+            xpath(f"{CARD_CONTENT_XPATH}/{CONNECTIONS_XPATH}")
+        ],
+        "summary": [
+            css("p.entity-result__summary"),
+            xpath(f"{CARD_CONTENT_XPATH}/{SUMMARY_XPATH}")
+        ],
+        "next_button": [
+            css("button[aria-label='Next']", "data"),
+            css("button.artdeco-pagination__button--next"),
+            xpath("//button[normalize-space()='Next']", "text")
+        ]
+    }
+    LOCATOR_TYPES = {"css": "css selector", "xpath": "xpath"}
+    FALLBACK_TIMEOUT = 1
+    HEADLESS_LINK_MARKER = "headless?origin=OTHER&keywords="
+    ALREADY_COLLECTED = object()
+    EXTRACTION_MODES = ("batch", "element", "html")
 
-    def __init__(self, driver):
-        self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
-        self.profiles = []
+    def __init__(self, driver=None, extraction_mode="batch", waiter=None, base_url="https://www.linkedin.com",
+                 seen_index=None, pacer=None, metrics=None, selectors=None, enricher=None,
+                 parser_workers=0, recorder=None, backend=None):
+        if extraction_mode not in self.EXTRACTION_MODES:
+            raise ValueError(f"Unknown extraction mode: {extraction_mode}")
+        self.waiter = waiter or PageWaiter(driver)
+        self.backend = backend or SeleniumBackend(driver, self.waiter)
+        self.driver = driver = self.backend.driver
+        if extraction_mode == "element" and not driver:
+            raise ValueError(f"Element extraction needs a browser, not the {self.backend.name} backend")
+        self.base_url = base_url.rstrip("/")
+        self.pacer = pacer or RequestPacer()
+        self.metrics = metrics or RunMetrics()
+        self.selectors = selectors or SelectorRegistry(self.SELECTOR_CHAINS)
+        self.enricher = enricher
+        self.parser_workers = parser_workers
+        self.recorder = recorder
+        self.current_page = None
+        self.profiles = ProfileBatch()
+        self.profile_count = 0
+        self.skipped_count = 0
+        self.search_completed = False
+        self.pages_exhausted = False
+        self.cancelled = False
+        self.seen_index = seen_index
+        self._collected_keys = set()
+        self.extraction_mode = extraction_mode
+        self.command_counter = DriverCommandCounter.attach(driver or self.backend)
+        self.page_command_counts = []
+        self.html_parser = None
+        if extraction_mode == "html":
+            from html_profile_parser import HtmlProfileParser
+            self.html_parser = HtmlProfileParser(self.CARD_FIELDS)
 
-    def _wait_for_element(self, by, value, timeout=10, element=None):
-        try:
-            wait_condition = EC.presence_of_element_located((by, value))
-            if element:
-                return WebDriverWait(element, timeout).until(wait_condition)
-            
-            element = WebDriverWait(self.driver, timeout).until(wait_condition)
-            WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of(element)
-            )
-            return element
-        except TimeoutException:
-            return None
+    def _locator(self, selector):
+        return self.LOCATOR_TYPES[selector.kind], selector.expression
+
+    def _record_selectors(self, field, chain, hit_index, count=1):
+        misses = self.selectors.record(field, chain, hit_index, count)
+        if misses:
+            self.metrics.increment("selector_misses", misses)
+
+    def _record_card_lookups(self, chains, result):
+        self._record_selectors("card", chains["card"], result["card_hit"])
+        for field in self.CARD_FIELDS:
+            hits = Counter(card["hits"][field] for card in result["cards"])
+            for hit_index, count in hits.items():
+                self._record_selectors(field, chains[field], hit_index, count)
+
+    def _card_chains(self):
+        return {field: self.selectors.chain(field) for field in ("card",) + self.CARD_FIELDS}
+
+    def _find_card_elements(self):
+        chain = self.selectors.chain("card")
+        for index, selector in enumerate(chain):
+            elements = self.driver.find_elements(*self._locator(selector))
+            if elements:
+                self._record_selectors("card", chain, index)
+                return elements
+        self._record_selectors("card", chain, -1)
+        return []
+
+    def _find_field(self, card, field):
+        chain = self.selectors.chain(field)
+        for index, selector in enumerate(chain):
+            elements = card.find_elements(*self._locator(selector))
+            if not elements:
+                continue
+            self._record_selectors(field, chain, index)
+            return elements[0]
+        self._record_selectors(field, chain, -1)
+        return None
+
+    def _is_known_profile_key(self, key):
+        if not key:
+            return False
+        return key in self._collected_keys or (self.seen_index is not None and self.seen_index.contains(key))
+
+    def _accept_profile(self, profile):
+        key = profile_key(profile)
+        if self._is_known_profile_key(key):
+            self.skipped_count += 1
+            return False
+        if key:
+            self._collected_keys.add(key)
+        return True
 
     def _safe_get_element_text(self, element, default="N/A"):
         if not element:
@@ -52,93 +178,220 @@ class LinkedinSearch:
         text = element.text.strip()
         return text if text else default
 
-    def _extract_profile_data(self, base_xpath):
+    def _extract_profile_data(self, card):
         try:
             profile = LinkedinProfile()
             
-            try:
-                link_element = self.driver.find_element(By.XPATH, f"{base_xpath}/{self.PROFILE_LINK_XPATH}")
-                profile_link = link_element.get_attribute("href")
-                profile.profile_link = "N/A" if "headless?origin=OTHER&keywords=" in profile_link else profile_link
-                
-                name_element = self.driver.find_element(By.XPATH, f"{base_xpath}/{self.NAME_XPATH}")
-                profile.name = name_element.text.strip()
-            except NoSuchElementException:
+            link_element = self._find_field(card, "profile_link")
+            if link_element:
+                profile_link = link_element.get_attribute("href") or ""
+                profile.profile_link = "N/A" if self.HEADLESS_LINK_MARKER in profile_link else profile_link
+                if self._is_known_profile_key(normalize_profile_link(profile.profile_link)):
+                    self.skipped_count += 1
+                    return self.ALREADY_COLLECTED
+                profile.name = self._safe_get_element_text(self._find_field(card, "name"))
+            else:
                 profile.name = "N/A"
-            
-            try:
-                title_element = self.driver.find_element(By.XPATH, f"{base_xpath}/{self.TITLE_XPATH}")
-                profile.title = title_element.text.strip()
-            except NoSuchElementException:
-                profile.title = "N/A"
-            
-            try:
-                location_element = self.driver.find_element(By.XPATH, f"{base_xpath}/{self.LOCATION_XPATH}")
-                profile.location = location_element.text.strip()
-            except NoSuchElementException:
-                profile.location = "N/A"
-            
-            try:
-                connections_element = self.driver.find_element(By.XPATH, f"{base_xpath}/{self.CONNECTIONS_XPATH}")
-                profile.connections = connections_element.text.strip()
-            except NoSuchElementException:
-                profile.connections = "N/A"
 
-            try:
-                summary_element = self.driver.find_element(By.XPATH, f"{base_xpath}/{self.SUMMARY_XPATH}")
-                profile.summary = summary_element.text.strip()
-            except NoSuchElementException:
-                profile.summary = "N/A"
+            for field in ("title", "location", "connections", "summary"):
+                setattr(profile, field, self._safe_get_element_text(self._find_field(card, field)))
             
-            if profile.name != "N/A" or (profile.profile_link and not profile.profile_link.isspace()):
-                return profile
-            return None
+            return profile if self._is_valid_profile(profile) else None
 
         except Exception as e:
             print(f"Error extracting profile data: {str(e)}")
             return None
 
-    def search_profiles(self, search_term, max_profiles=100):
+    def _is_valid_profile(self, profile):
+        return profile.name != "N/A" or bool(profile.profile_link and not profile.profile_link.isspace())
+
+    def _normalize_card(self, card):
+        profile_link = card.get("profile_link")
+        if profile_link is None:
+            profile_link, name = "", "N/A"
+        else:
+            profile_link = "N/A" if self.HEADLESS_LINK_MARKER in profile_link else profile_link
+            name = card.get("name")
+        profile = {"name": "N/A" if name is None else name, "profile_link": profile_link}
+        for field in ("title", "location", "summary", "connections"):
+            value = card.get(field)
+            profile[field] = "N/A" if value is None else value
+        return profile
+
+    def _extract_profile_cards(self, profiles_to_extract=10):
+        chains = self._card_chains()
+        result = self.backend.query_cards(chains, self.CARD_FIELDS, profiles_to_extract)
+        self._record_card_lookups(chains, result)
+        return [self._normalize_card(card) for card in result["cards"]]
+
+    def _capture_snapshot(self):
+        page_source, page_url = self.backend.snapshot()
+        if self.recorder:
+            self.recorder.record(self.current_page, page_source, page_url)
+        return page_source, page_url
+
+    def _record_page_snapshot(self):
+        if self.recorder and self.extraction_mode != "html":
+            self._capture_snapshot()
+
+    def _parse_snapshot(self, page_source, page_url, profiles_to_extract=10, parser=None):
+        chains = self._card_chains()
+        with self.metrics.span("parse"):
+            result = (parser or self.html_parser).parse_cards(page_source, chains, page_url, profiles_to_extract)
+        self._record_card_lookups(chains, result)
+        return [self._normalize_card(card) for card in result["cards"]]
+
+    def _build_results_url(self, search_term, page=1):
+        params = {"keywords": search_term}
+        if page > 1:
+            params["page"] = page
+        return f"{self.base_url}/search/results/people/?{urlencode(params)}"
+
+    def _count_results(self):
+        return self.backend.count(self.selectors.ordered("card"))
+
+    def _open_results_url(self, search_term, page):
+        label = f"results page {page}"
+        url = self._build_results_url(search_term, page)
+        elapsed = self.pacer.navigate(label, lambda: (self.backend.navigate(url), self.backend.wait_until_ready()))
+        found = self._count_results() > 0
+        self.pacer.record(label, elapsed, "ok" if found else "empty")
+        return found
+
+    def _load_results_page(self, search_term, page):
+        with self.metrics.span("navigation"):
+            return self._navigate_to_results_page(search_term, page)
+
+    def _navigate_to_results_page(self, search_term, page):
+        if self._open_results_url(search_term, page):
+            return True
+
+        if page <= 1:
+            return False
+
+        print(f"Direct navigation to page {page} returned no results, falling back to the Next button")
+        if not self._open_results_url(search_term, page - 1) or not self._go_to_next_page():
+            return False
+        return self._count_results() > 0
+
+    def _scroll_results_into_view(self, profiles_to_extract=10):
+        with self.metrics.span("scroll"):
+            return self.backend.render(self.selectors.ordered("card"), profiles_to_extract)
+
+    def scrape_page(self, search_term, page, profiles_to_extract=10):
+        if not self._load_results_page(search_term, page):
+            return None
+        self.current_page = page
+        self._scroll_results_into_view(profiles_to_extract)
+        self._record_page_snapshot()
+        return self._extract_profiles_from_page(profiles_to_extract)
+
+    def _record_checkpoint(self, checkpoint, sink, page_number, profile_count, page_profiles):
+        if not checkpoint:
+            if sink and page_profiles:
+                sink.write_batch(page_profiles)
+            return
+        if sink:
+            sink.write_batch(
+                page_profiles,
+                on_written=lambda rows: checkpoint.record_page(page_number, profile_count, rows)
+            )
+        else:
+            checkpoint.record_page(page_number, profile_count, len(page_profiles))
+
+    def search_profiles(self, search_term, max_profiles=100, start_page=1, sink=None, checkpoint=None,
+                        progress_callback=None, cancel_event=None, end_page=None):
+        with self.metrics.span("search"):
+            return self._search_profiles(
+                search_term, max_profiles, start_page, sink, checkpoint, progress_callback, cancel_event, end_page
+            )
+
+    def _search_profiles(self, search_term, max_profiles, start_page, sink, checkpoint, progress_callback,
+                         cancel_event, end_page=None):
         try:
             profiles_per_page = 10
-            pages_to_scrape = (max_profiles + profiles_per_page - 1) // profiles_per_page
-            excel_creator = ExcelCreator()
-            
-            print(f"Searching for '{search_term}' and collecting {max_profiles} profiles ({pages_to_scrape} pages)")
-            self.driver.get(f"https://www.linkedin.com/search/results/people/?keywords={search_term}")
-            time.sleep(5)
-            self._wait_for_element(By.XPATH, "//div[contains(@class, 'search-results-container')]")
-            
-            page_count = 0
             profile_count = 0
+            skipped_before = self.skipped_count
+            self.search_completed = False
+            if checkpoint and checkpoint.last_completed_page:
+                start_page = checkpoint.next_page
+                profile_count = self.profile_count = checkpoint.profile_count
+                print(f"Resuming from page {start_page} with {profile_count} profiles already collected")
+            pages_to_scrape = (max_profiles - profile_count + profiles_per_page - 1) // profiles_per_page
             
-            while profile_count < max_profiles:
-                page_count += 1
-                print(f"\nScanning page {page_count}...")
-                
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
-                time.sleep(2)
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(3)
+            print(f"Searching for '{search_term}' and collecting {max_profiles} profiles ({pages_to_scrape} pages from page {start_page})")
+            page_number = start_page
+            pipelined = self._use_pipeline() and profile_count < max_profiles
+            if pipelined:
+                from search_pipeline import SearchPipeline
+                profile_count, page_ready = SearchPipeline(self, self.parser_workers).run(
+                    search_term, max_profiles, start_page, profile_count, sink, checkpoint, progress_callback,
+                    cancel_event, end_page
+                )
+                if cancel_event and cancel_event.is_set() and profile_count < max_profiles:
+                    self.cancelled = True
+            else:
+                page_ready = (profile_count < max_profiles and (not end_page or page_number <= end_page)
+                              and self._load_results_page(search_term, page_number))
+            
+            while not pipelined and page_ready and profile_count < max_profiles and not self.cancelled:
+                print(f"\nScanning page {page_number}...")
                 
                 remaining_profiles = max_profiles - profile_count
-                profiles_to_extract = min(10, remaining_profiles)
-                
-                page_profiles = self._extract_profiles_from_page(profiles_to_extract)
+                profiles_to_extract = profiles_per_page if self.seen_index is not None else min(profiles_per_page, remaining_profiles)
+                self.current_page = page_number
+                self._scroll_results_into_view(profiles_to_extract)
+                self._record_page_snapshot()
+
+                next_page = page_number + 1
+                last_page = bool(end_page) and page_number >= end_page
+                load_next_page = lambda: self._load_results_page(search_term, next_page)
+                if self.extraction_mode == "html":
+                    navigate = (load_next_page if profile_count + profiles_to_extract < max_profiles and not last_page
+                                else None)
+                    page_profiles, page_ready = self._extract_profiles_while_navigating(profiles_to_extract, navigate)
+                else:
+                    page_profiles, page_ready = self._extract_profiles_from_page(profiles_to_extract), None
+                page_profiles = page_profiles[:remaining_profiles]
+                if self.enricher and len(page_profiles):
+                    page_profiles = self.enricher.enrich(page_profiles)
+                self._record_page_metrics(page_number, page_profiles)
                 if page_profiles:
-                    self.profiles.extend(page_profiles)
+                    if not sink:
+                        self.profiles.extend(page_profiles)
                     profile_count += len(page_profiles)
-                    print(f"Found and added {len(page_profiles)} profiles from page {page_count}. Total: {profile_count}")
+                    self.profile_count = profile_count
+                    print(f"Found and added {len(page_profiles)} profiles from page {page_number}. Total: {profile_count}")
+                self._record_checkpoint(checkpoint, sink, page_number, profile_count, page_profiles)
+                if progress_callback:
+                    progress_callback(page_number, profile_count, max_profiles)
                 
                 if profile_count >= max_profiles:
                     break
-                    
-                if not self._go_to_next_page():
-                    print("No more pages available")
+
+                if last_page:
+                    print(f"Reached page {end_page}, the last page assigned to this search.")
+                    page_ready = True
                     break
-                
-                time.sleep(3) 
+
+                if cancel_event and cancel_event.is_set():
+                    print(f"Search cancelled after page {page_number}.")
+                    self.cancelled = True
+                    break
+
+                if page_ready is None:
+                    page_ready = load_next_page()
+                page_number = next_page
+
+            if not page_ready and profile_count < max_profiles:
+                print("No more pages available")
+                self.pages_exhausted = True
+            self.search_completed = not self.cancelled
             
+            skipped_count = self.skipped_count - skipped_before
+            self.metrics.increment("profiles_skipped", skipped_count)
+            if skipped_count:
+                print(f"\nSkipped {skipped_count} already collected profiles.")
             print(f"\nSearch completed. Found and saved {profile_count} profiles.")
             return self.profiles
 
@@ -146,14 +399,98 @@ class LinkedinSearch:
             print(f"Error occurred during profile search: {str(e)}")
             return 0
 
+    def _use_pipeline(self):
+        if not self.parser_workers or self.extraction_mode != "html":
+            return False
+        if self.enricher:
+            print("Profile enrichment shares the browser with the search, running the pages one by one")
+            return False
+        return True
+
+    def _record_page_metrics(self, page_number, page_profiles):
+        if self.recorder:
+            self.recorder.record_profiles(page_number, len(page_profiles))
+        self.metrics.increment("pages")
+        self.metrics.increment("profiles", len(page_profiles))
+        self.metrics.increment("na_fields", sum(values.count("N/A") for values in page_profiles.columns.values()))
+
+    def _record_page_commands(self):
+        commands = self.command_counter.reset()
+        self.page_command_counts.append(commands)
+        self.metrics.increment("driver_commands", commands)
+        print(f"Page extraction used {commands} driver commands ({self.extraction_mode} mode)")
+
     def _extract_profiles_from_page(self, profiles_to_extract=10):
-        page_profiles = []
-        time.sleep(2)
-        for i in range(1, profiles_to_extract + 1):
+        self.command_counter.reset()
+        with self.metrics.span("extraction"):
+            if self.extraction_mode == "batch":
+                page_profiles = self._extract_profiles_batch(profiles_to_extract)
+            elif self.extraction_mode == "html":
+                page_profiles = self._extract_profiles_html(profiles_to_extract)
+            else:
+                page_profiles = self._extract_profiles_by_element(profiles_to_extract)
+        self._record_page_commands()
+        return page_profiles
+
+    def _extract_profiles_while_navigating(self, profiles_to_extract=10, navigate=None):
+        self.command_counter.reset()
+        try:
+            with self.metrics.span("extraction"):
+                snapshot = self._capture_snapshot()
+        except Exception as e:
+            print(f"Error capturing page source: {str(e)}")
+            return ProfileBatch(), None
+        self._record_page_commands()
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            parse_future = executor.submit(self._parse_snapshot, *snapshot, profiles_to_extract)
+            page_ready = navigate() if navigate else None
+            try:
+                cards = parse_future.result()
+            except Exception as e:
+                print(f"Error parsing page source: {str(e)}")
+                cards = []
+        return self._build_page_profiles(cards), page_ready
+
+    def _extract_profiles_html(self, profiles_to_extract=10):
+        try:
+            cards = self._parse_snapshot(*self._capture_snapshot(), profiles_to_extract)
+        except Exception as e:
+            print(f"Error parsing page source: {str(e)}")
+            return ProfileBatch()
+        return self._build_page_profiles(cards)
+
+    def _extract_profiles_batch(self, profiles_to_extract=10):
+        try:
+            cards = self._extract_profile_cards(profiles_to_extract)
+        except Exception as e:
+            print(f"Error extracting profile cards: {str(e)}")
+            return ProfileBatch()
+        return self._build_page_profiles(cards)
+
+    def _build_page_profiles(self, cards):
+        page_profiles = ProfileBatch()
+        for i, card in enumerate(cards, start=1):
+            profile = LinkedinProfile(**card) if card else None
+            if not profile or not self._is_valid_profile(profile):
+                print(f"Profile {i}: Could not extract valid profile data")
+            elif not self._accept_profile(profile):
+                print(f"Profile {i}: {profile.name} already collected, skipped")
+            else:
+                page_profiles.append(profile)
+                print(f"Profile {i}: {profile.name} - {profile.title}")
+        return page_profiles
+
+    def _extract_profiles_by_element(self, profiles_to_extract=10):
+        page_profiles = ProfileBatch()
+        for i, card in enumerate(self._find_card_elements()[:profiles_to_extract], start=1):
             try:
-                base_xpath = self.PROFILE_BASE_XPATH.format(index=i)
-                profile = self._extract_profile_data(base_xpath)
-                if profile:
+                profile = self._extract_profile_data(card)
+                if profile is self.ALREADY_COLLECTED:
+                    print(f"Profile {i}: already collected, skipped")
+                elif profile and not self._accept_profile(profile):
+                    print(f"Profile {i}: {profile.name} already collected, skipped")
+                elif profile:
                     page_profiles.append(profile)
                     print(f"Profile {i}: {profile.name} - {profile.title}")
                 else:
@@ -161,22 +498,55 @@ class LinkedinSearch:
             except Exception as e:
                 print(f"Error processing profile {i}: {str(e)}")
                 continue
-        return page_profiles if page_profiles else []
+        return page_profiles
 
     def _go_to_next_page(self):
+        with self.metrics.span("next_page"):
+            return self._click_next_page() if self.driver else self._follow_next_link()
+
+    def _find_next_button(self):
+        chain = self.selectors.chain("next_button")
+        for index, selector in enumerate(chain):
+            timeout = 5 if index == 0 else self.FALLBACK_TIMEOUT
+            next_button = self.waiter.wait_for_element(*self._locator(selector), timeout=timeout, visible=True)
+            if next_button:
+                self._record_selectors("next_button", chain, index)
+                return next_button
+        self._record_selectors("next_button", chain, -1)
+        return None
+
+    def _follow_next_link(self):
+        chain = self.selectors.chain("next_button")
+        hit_index, next_url = self.backend.find_next_link(chain)
+        self._record_selectors("next_button", chain, hit_index)
+        if not next_url:
+            print("No more pages found")
+            return False
+
+        elapsed = self.pacer.navigate("next page", lambda: self.backend.navigate(next_url))
+        found = self.backend.wait_until_ready() and self._count_results() > 0
+        self.pacer.record("next page", elapsed, "ok" if found else "empty")
+        print("Moving to next page...")
+        return found
+
+    def _click_next_page(self):
         try:
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
-
-            for selector in self.NEXT_BUTTON_SELECTORS:
-                next_button = self._wait_for_element(By.XPATH, selector, timeout=5)
-                if next_button and next_button.is_enabled():
-                    self.driver.execute_script("arguments[0].scrollIntoView(true);", next_button)
-                    time.sleep(1)
-                    next_button.click()
-                    print("Moving to next page...")
-                    time.sleep(3)
-                    return True
+            first_item = self.selectors.ordered("card")
+            previous_state = self.waiter.pagination_state(first_item)
+
+            next_button = self._find_next_button()
+            if next_button and next_button.is_enabled():
+                self.driver.execute_script("arguments[0].scrollIntoView(true);", next_button)
+                elapsed = self.pacer.navigate("next page", next_button.click)
+                print("Moving to next page...")
+                if not self.waiter.wait_for_pagination_change(previous_state, first_item):
+                    print("Page did not change after clicking next")
+                    self.pacer.record("next page", elapsed, "error")
+                    return False
+                self.waiter.wait_for_ready_state()
+                self.pacer.record("next page", elapsed)
+                return True
             
             print("No more pages found")
             return False
@@ -1,21 +1,39 @@
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from pathlib import Path
+import hashlib
 import json
 import os
 import time
+from urllib.parse import urlparse
 from dotenv import load_dotenv
 from selenium.webdriver.firefox.options import Options
+from page_waiter import PageWaiter
+from page_backend import SeleniumBackend
+from request_pacer import RequestPacer
+from run_metrics import RunMetrics
 
 class LinkedinLogin:
-    def __init__(self, driver):
-        self.driver = driver
+    DEFAULT_BASE_URL = "https://www.linkedin.com"
+    REQUIRED_COOKIES = ("li_at",)
+    COOKIE_INJECTION_PATH = "/robots.txt"
+    SESSION_CHECK_PATH = "/feed/"
+    SESSION_CACHE_TTL = 15 * 60
+
+    def __init__(self, driver=None, waiter=None, base_url=DEFAULT_BASE_URL, session_cache_ttl=SESSION_CACHE_TTL,
+                 pacer=None, metrics=None, backend=None):
+        self.base_url = base_url.rstrip("/")
         self.cookies_dir = "cookies"
-        self.cookies_file = os.path.join(self.cookies_dir, "linkedin_cookies.json")
+        self.cookies_file = os.path.join(self.cookies_dir, self._cookies_filename())
+        self.session_cache_file = os.path.join(self.cookies_dir, "session_status.json")
+        self.session_cache_ttl = session_cache_ttl
+        self.waiter = waiter or PageWaiter(driver)
+        self.backend = backend or SeleniumBackend(driver, self.waiter)
+        self.driver = driver = self.backend.driver
         self.wait = WebDriverWait(driver, 10)
+        self.pacer = pacer or RequestPacer()
+        self.metrics = metrics or RunMetrics()
         
         load_dotenv()
 
@@ -30,6 +48,12 @@ class LinkedinLogin:
             "password": password
         }
 
+    def _cookies_filename(self):
+        if self.base_url == self.DEFAULT_BASE_URL:
+            return "linkedin_cookies.json"
+        host = urlparse(self.base_url).netloc.replace(":", "_")
+        return f"linkedin_cookies_{host}.json"
+
     def _handle_operation(self, operation_name, operation_func):
         try:
             return operation_func()
@@ -39,7 +63,7 @@ class LinkedinLogin:
 
     def save_cookies(self):
         def _save():
-            cookies = self.driver.get_cookies()
+            cookies = self.backend.get_cookies()
             if not cookies:
                 print("WARNING: No cookies were retrieved!")
                 return False
@@ -47,11 +71,71 @@ class LinkedinLogin:
             Path(self.cookies_dir).mkdir(exist_ok=True)
             with open(self.cookies_file, "w") as f:
                 json.dump(cookies, f)
+            self._cache_session_verdict(self._session_fingerprint(cookies), True)
             print("Cookies saved successfully.")
             return True
 
         return self._handle_operation("saving cookies", _save)
 
+    def _expired_required_cookies(self, cookies):
+        now = time.time()
+        by_name = {cookie.get("name"): cookie for cookie in cookies}
+        expired = []
+        for name in self.REQUIRED_COOKIES:
+            cookie = by_name.get(name)
+            if not cookie or ("expiry" in cookie and cookie["expiry"] <= now):
+                expired.append(name)
+        return expired
+
+    def _session_fingerprint(self, cookies):
+        values = sorted(f"{cookie.get('name')}={cookie.get('value')}" for cookie in cookies
+                        if cookie.get("name") in self.REQUIRED_COOKIES)
+        return hashlib.sha256(f"{self.base_url}|{'|'.join(values)}".encode("utf-8")).hexdigest()
+
+    def _read_session_cache(self):
+        try:
+            with open(self.session_cache_file, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _cached_session_valid(self, fingerprint):
+        entry = self._read_session_cache().get(fingerprint)
+        return bool(entry and entry.get("valid") and time.time() - entry.get("checked_at", 0) < self.session_cache_ttl)
+
+    def _cache_session_verdict(self, fingerprint, valid):
+        cache = {key: entry for key, entry in self._read_session_cache().items()
+                 if time.time() - entry.get("checked_at", 0) < self.session_cache_ttl}
+        cache[fingerprint] = {"valid": valid, "checked_at": time.time()}
+        try:
+            Path(self.cookies_dir).mkdir(exist_ok=True)
+            with open(self.session_cache_file, "w") as f:
+                json.dump(cache, f)
+        except OSError as e:
+            print(f"Could not write session cache: {str(e)}")
+
+    def invalidate_session_cache(self):
+        def _invalidate():
+            with open(self.cookies_file, "r") as f:
+                fingerprint = self._session_fingerprint(json.load(f))
+            self._cache_session_verdict(fingerprint, False)
+            return True
+
+        return self._handle_operation("invalidating session cache", _invalidate)
+
+    def _navigate(self, label, action):
+        elapsed = self.pacer.navigate(label, action)
+        ready = self.backend.wait_until_ready()
+        self.pacer.record(label, elapsed, "ok" if ready else "error")
+        return ready
+
+    def _inject_cookies(self, cookies):
+        if self.driver:
+            self._navigate(
+                "cookie injection page", lambda: self.backend.navigate(f"{self.base_url}{self.COOKIE_INJECTION_PATH}")
+            )
+        self.backend.add_cookies(cookies)
+
     def load_cookies(self):
         def _load():
             if not os.path.exists(self.cookies_file):
@@ -65,31 +149,25 @@ class LinkedinLogin:
                 print("Cookie file is empty or invalid.")
                 return False
 
-            self.driver.get("https://www.linkedin.com")
-            print("Linkedin homepage loaded.")
-            time.sleep(5)
-
-            for cookie in cookies:
-                try:
-                    if 'expiry' in cookie and isinstance(cookie['expiry'], float):
-                        cookie['expiry'] = int(cookie['expiry'])
-                    self.driver.add_cookie(cookie)
-                except Exception as e:
-                    print(f"Error adding cookie: {str(e)}")
-
-            self.driver.refresh()
-            time.sleep(3)
-
-            try:
-                WebDriverWait(self.driver, 10).until(
-                    lambda driver: driver.execute_script('return document.readyState') == 'complete'
-                )
-            except TimeoutException:
-                print("Page failed to load completely after refresh")
+            expired = self._expired_required_cookies(cookies)
+            if expired:
+                print(f"Saved session is missing or has expired cookies: {', '.join(expired)}")
+                return False
+
+            fingerprint = self._session_fingerprint(cookies)
+            self._inject_cookies(cookies)
+            if self._cached_session_valid(fingerprint):
+                print("Login successful with cookies (cached session check).")
+                return True
+
+            if not self._navigate("session check",
+                                  lambda: self.backend.navigate(f"{self.base_url}{self.SESSION_CHECK_PATH}")):
+                print("Page failed to load completely while checking the session")
                 return False
 
-            current_url = self.driver.current_url
-            if self._is_logged_in_url(current_url):
+            valid = self._is_logged_in_url(self.backend.current_url)
+            self._cache_session_verdict(fingerprint, valid)
+            if valid:
                 print("Login successful with cookies.")
                 return True
 
@@ -101,30 +179,30 @@ class LinkedinLogin:
     def _is_logged_in_url(self, url):
         return any(url_part in url for url_part in ["feed", "mynetwork", "messaging", "notifications"])
 
-    def _wait_for_element(self, by, value, timeout=10):
-        try:
-            return WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located((by, value))
-            )
-        except TimeoutException:
+    def _wait_for_element(self, by, value, timeout=None):
+        element = self.waiter.wait_for_element(by, value, timeout=timeout)
+        if not element:
             print(f"Element not found: {value}")
-            return None
+        return element
 
     def login(self):
         def _login():
             if self.load_cookies():
                 return True
 
-            self.driver.get("https://www.linkedin.com/login")
-            time.sleep(2)
+            if not self.driver:
+                print(f"The {self.backend.name} backend can only reuse a saved session. "
+                      "Log in once with the Firefox backend to save the session cookies.")
+                return False
+
+            self._navigate("login page", lambda: self.driver.get(f"{self.base_url}/login"))
 
             email_field = self._wait_for_element(By.ID, "username")
             password_field = self._wait_for_element(By.ID, "password")
 
             if not email_field or not password_field:
                 print("Login form elements not found. Retrying after refresh...")
-                self.driver.refresh()
-                time.sleep(3)
+                self._navigate("login page", self.driver.refresh)
                 email_field = self._wait_for_element(By.ID, "username")
                 password_field = self._wait_for_element(By.ID, "password")
                 if not email_field or not password_field:
@@ -137,16 +215,15 @@ class LinkedinLogin:
             if not login_button:
                 return False
 
-            login_button.click()
-            time.sleep(5)
+            login_url = self.driver.current_url
+            elapsed = self.pacer.navigate("login submit", login_button.click)
+            self.waiter.wait_for_url_change(login_url)
 
-            try:
-                WebDriverWait(self.driver, 10).until(
-                    lambda driver: driver.execute_script('return document.readyState') == 'complete'
-                )
-            except TimeoutException:
+            if not self.waiter.wait_for_ready_state():
+                self.pacer.record("login submit", elapsed, "error")
                 print("Page failed to load completely after login")
                 return False
+            self.pacer.record("login submit", elapsed)
 
             if self._is_logged_in_url(self.driver.current_url):
                 self.save_cookies()
@@ -154,10 +231,12 @@ class LinkedinLogin:
 
             return False
 
-        return self._handle_operation("login", _login)
+        with self.metrics.span("login"):
+            return self._handle_operation("login", _login)
 
-def create_firefox_driver():
+def create_firefox_driver(headless=False):
     options = Options()
-    options.headless = False
+    if headless:
+        options.add_argument("-headless")
     driver = webdriver.Firefox(options=options)
     return driver
@@ -1,60 +1,330 @@
-from selenium import webdriver
-from selenium.webdriver.firefox.options import Options
-from selenium.webdriver.firefox.service import Service
-from login import LinkedinLogin
 from linkedin_profile_search import LinkedinSearch
 from excel_creator import ExcelCreator
+from profile_index import SeenProfileIndex
+from search_checkpoint import SearchCheckpoint, load_checkpoint
+from profile_batch import ProfileBatch
+from session_daemon import daemon_available, submit_job, unsupported_job_options
+from request_pacer import PacerConfig, RequestPacer
+from run_metrics import RunMetrics
+from selector_registry import SelectorRegistry
+from profile_enricher import ProfileEnricher
+from page_recorder import PageRecorder
+from page_backend import PageBackend, SeleniumBackend, create_page_backend
+from batch_jobs import BatchJob, BatchManifest, load_jobs, manifest_path
 import os
+import queue
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Tuple
-from dataclasses import dataclass
-from typing import Optional, List
+from dataclasses import dataclass, replace
+from typing import Callable, Optional, List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from selenium import webdriver
+    from selenium.webdriver.firefox.options import Options
+    from page_waiter import PageWaiter
 
 @dataclass
 class ScrapingConfig:
     search_term: str
     max_profiles: int
+    extraction_mode: str = "batch"
+    wait_timeout: float = 10.0
+    poll_interval: float = 0.1
+    stable_period: float = 0.5
+    workers: int = 1
+    base_url: str = "https://www.linkedin.com"
+    lean_browser: bool = False
+    ignore_seen_index: bool = False
+    resume: bool = False
+    no_daemon: bool = False
+    jobs_file: Optional[str] = None
+    request_rate: float = 1.0
+    request_burst: int = 3
+    fixed_rate: bool = False
+    pacer_log: str = os.path.join("logs", "pacer_decisions.jsonl")
+    report_directory: str = "reports"
+    prometheus_file: Optional[str] = None
+    enrich_tabs: int = 0
+    parser_workers: int = 0
+    record_directory: Optional[str] = None
+    page_backend: str = "firefox"
+    replay_file: Optional[str] = None
+    render_excel: bool = False
 
 class ArgumentValidator:
+    PAGE_BACKENDS = ("firefox", "http", "replay")
+    HELP_FLAGS = ("-h", "--help")
+    OPTIONS = {
+        "--workers": ("workers", int),
+        "--base-url": ("base_url", str),
+        "--extraction-mode": ("extraction_mode", str),
+        "--lean": ("lean_browser", bool),
+        "--ignore-seen-index": ("ignore_seen_index", bool),
+        "--resume": ("resume", bool),
+        "--no-daemon": ("no_daemon", bool),
+        "--jobs": ("jobs_file", str),
+        "--rate": ("request_rate", float),
+        "--burst": ("request_burst", int),
+        "--fixed-rate": ("fixed_rate", bool),
+        "--prometheus": ("prometheus_file", str),
+        "--enrich": ("enrich_tabs", int),
+        "--parser-workers": ("parser_workers", int),
+        "--record": ("record_directory", str),
+        "--backend": ("page_backend", str),
+        "--replay": ("replay_file", str),
+        "--render-excel": ("render_excel", bool),
+        "--wait-timeout": ("wait_timeout", float),
+        "--poll-interval": ("poll_interval", float),
+        "--stable-period": ("stable_period", float)
+    }
+
+    def usage(self) -> str:
+        return (
+            "This program requires exactly 2 arguments:\n\n" 
+            "1. Search keyword (in quotes)\n" 
+            "2. Number of profiles to search\n\n" 
+            "Options:\n"
+            "--workers N              Number of Firefox instances that share the result pages\n"
+            "--base-url URL           Site to scrape (e.g. a local stand-in server)\n"
+            "--extraction-mode MODE   batch, element or html\n"
+            "--lean                   Headless Firefox without images, fonts and media\n"
+            "--ignore-seen-index      Collect and export profiles found in earlier runs again\n"
+            "--resume                 Continue an interrupted search from its last completed page\n"
+            "--no-daemon              Start a new browser even if the session daemon is running\n"
+            "--jobs FILE              Run every job in a JSONL/CSV file (term, max_profiles, priority)\n"
+            "                         instead of a single search; --workers sets the number of sessions\n"
+            "--rate N                 Navigations per second to start from (default 1.0)\n"
+            "--burst N                Navigations allowed back to back before pacing applies (default 3)\n"
+            "--fixed-rate             Keep the rate fixed instead of adapting it to page health\n"
+            "--prometheus FILE        Also write the run metrics in Prometheus text format\n"
+            "--enrich N               Add experience and education from each profile page, N tabs at a time\n"
+            "--parser-workers N       In html mode, parse pages on N threads while the browser loads the next ones\n"
+            "--record DIR             Save every results page as compressed HTML for offline replay\n"
+            "--backend NAME           firefox (default) or http, which fetches pages with the saved session cookies\n"
+            "--replay FILE            Run the search against a recording made with --record instead of the site\n"
+            "--render-excel           Also render the Excel file from the export store after the search\n"
+            "--wait-timeout SECONDS   Longest wait for a page, element or result count (default 10)\n"
+            "--poll-interval SECONDS  Time between checks while waiting (default 0.1)\n"
+            "--stable-period SECONDS  How long the result count must stay unchanged to count as loaded (default 0.5)\n"
+            "-h, --help               Show this message and exit\n\n"
+            "Example usage:\n" 
+            "python main.py \"Software Engineer\" 100    # Search for 'Software Engineer' and get 100 profiles\n" 
+            "python main.py \"Data Scientist\" 50     # Search for 'Data Scientist' and get 50 profiles\n"
+            "python main.py \"Data Scientist\" 500 --workers 4     # Share 50 result pages across 4 browsers\n"
+            "python main.py --jobs nightly.jsonl --workers 2     # Run a job file over 2 logged-in browsers\n"
+        )
+
+    def _usage_error(self) -> ValueError:
+        return ValueError(f"Invalid number of arguments. {self.usage()}")
+
+    def wants_help(self, args: list) -> bool:
+        return any(arg in self.HELP_FLAGS for arg in args[1:])
+
+    def _split_options(self, args: list) -> Tuple[list, dict]:
+        positionals = []
+        options = {}
+        index = 0
+        while index < len(args):
+            arg = args[index]
+            if arg not in self.OPTIONS:
+                positionals.append(arg)
+                index += 1
+                continue
+
+            name, value_type = self.OPTIONS[arg]
+            if value_type is bool:
+                options[name] = True
+                index += 1
+                continue
+
+            if index + 1 >= len(args):
+                raise ValueError(f"Missing value for option {arg}")
+            try:
+                options[name] = value_type(args[index + 1])
+            except ValueError:
+                raise ValueError(f"Invalid value for option {arg}: {args[index + 1]}")
+            index += 2
+        return positionals, options
+
+    def _validate_options(self, options: dict) -> None:
+        if options.get("workers", 1) <= 0:
+            raise ValueError("Worker count must be a positive number")
+        if options.get("request_rate", 1.0) <= 0:
+            raise ValueError("Request rate must be a positive number")
+        if options.get("request_burst", 1) <= 0:
+            raise ValueError("Request burst must be a positive number")
+        for name in ("wait_timeout", "poll_interval", "stable_period"):
+            if options.get(name, 1.0) <= 0:
+                raise ValueError(f"--{name.replace('_', '-')} must be a positive number of seconds")
+        if options.get("enrich_tabs", 0) < 0:
+            raise ValueError("Enrichment tab count cannot be negative")
+        if options.get("parser_workers", 0) < 0:
+            raise ValueError("Parser worker count cannot be negative")
+        if options.get("parser_workers") and options.get("extraction_mode", "batch") != "html":
+            raise ValueError("--parser-workers requires --extraction-mode html")
+        if options.get("replay_file"):
+            if not os.path.isfile(options["replay_file"]):
+                raise ValueError(f"Recording not found: {options['replay_file']}")
+            options["page_backend"] = "replay"
+        backend = options.get("page_backend", "firefox")
+        if backend not in self.PAGE_BACKENDS:
+            raise ValueError(f"Invalid backend: {backend}")
+        if backend == "replay" and not options.get("replay_file"):
+            raise ValueError("The replay backend needs a recording, pass it with --replay")
+        if backend != "firefox" and options.get("extraction_mode") == "element":
+            raise ValueError("Element extraction needs the firefox backend")
+        if backend != "firefox" and options.get("enrich_tabs"):
+            raise ValueError("--enrich needs the firefox backend")
+        if options.get("extraction_mode", "batch") not in LinkedinSearch.EXTRACTION_MODES:
+            raise ValueError(f"Invalid extraction mode: {options['extraction_mode']}")
+        if options.get("resume") and options.get("workers", 1) > 1 and not options.get("jobs_file"):
+            raise ValueError("--resume is only supported with a single worker")
+
     def validate_args(self, args: list) -> ScrapingConfig:
-        if len(args) != 3:
-            raise ValueError(
-                "Invalid number of arguments. This program requires exactly 2 arguments:\n\n" 
-                "1. Search keyword (in quotes)\n" 
-                "2. Number of profiles to search\n\n" 
-                "Example usage:\n" 
-                "python main.py \"Software Engineer\" 100    # Search for 'Software Engineer' and get 100 profiles\n" 
-                "python main.py \"Data Scientist\" 50     # Search for 'Data Scientist' and get 50 profiles\n"
-            )
+        positionals, options = self._split_options(args[1:])
+        if options.get("jobs_file"):
+            if positionals:
+                raise ValueError("--jobs cannot be combined with a search keyword and profile count")
+            if not os.path.isfile(options["jobs_file"]):
+                raise ValueError(f"Job file not found: {options['jobs_file']}")
+            self._validate_options(options)
+            return ScrapingConfig(search_term="", max_profiles=0, **options)
+
+        if len(positionals) != 2:
+            raise self._usage_error()
 
-        search_term = args[1]
+        search_term = positionals[0]
         try:
-            max_profiles = int(args[2])
+            max_profiles = int(positionals[1])
             if max_profiles <= 0:
                 raise ValueError("Profile count must be a positive number")
         except ValueError:
-            raise ValueError(f"Invalid profile count: {args[2]}. Must be a positive number.")
+            raise ValueError(f"Invalid profile count: {positionals[1]}. Must be a positive number.")
 
-        return ScrapingConfig(search_term=search_term, max_profiles=max_profiles)
+        self._validate_options(options)
+        return ScrapingConfig(search_term=search_term, max_profiles=max_profiles, **options)
 
 class BrowserManager:
+    LEAN_PREFERENCES = {
+        "permissions.default.image": 2,
+        "browser.display.use_document_fonts": 0,
+        "gfx.downloadable_fonts.enabled": False,
+        "media.autoplay.default": 5,
+        "media.mediasource.enabled": False,
+        "media.peerconnection.enabled": False,
+        "webgl.disabled": True,
+        "network.cookie.cookieBehavior": 1,
+        "privacy.trackingprotection.enabled": True,
+        "privacy.trackingprotection.socialtracking.enabled": True,
+        "network.prefetch-next": False,
+        "network.dns.disablePrefetch": True,
+        "network.http.speculative-parallel-limit": 0,
+        "browser.cache.disk.enable": False,
+        "browser.sessionstore.resume_from_crash": False,
+        "browser.shell.checkDefaultBrowser": False,
+        "browser.safebrowsing.malware.enabled": False,
+        "browser.safebrowsing.phishing.enabled": False,
+        "dom.webnotifications.enabled": False,
+        "geo.enabled": False,
+        "extensions.update.enabled": False,
+        "app.update.auto": False,
+        "datareporting.healthreport.uploadEnabled": False,
+        "toolkit.telemetry.enabled": False,
+        "fission.autostart": False,
+        "dom.ipc.processCount": 1
+    }
+    PAGE_LOAD_TIME_SCRIPT = """
+        const navigation = performance.getEntriesByType('navigation')[0];
+        if (navigation && navigation.loadEventEnd > 0) {
+            return navigation.loadEventEnd - navigation.startTime;
+        }
+        const timing = performance.timing;
+        return timing.loadEventEnd > 0 ? timing.loadEventEnd - timing.navigationStart : null;
+    """
+
     @staticmethod
-    def create_firefox_options() -> Options:
+    def create_firefox_options(lean: bool = False) -> "Options":
+        from selenium.webdriver.firefox.options import Options
+
         firefox_options = Options()
         firefox_options.add_argument("--disable-notifications") 
         firefox_options.add_argument("--disable-gpu")  
         firefox_options.page_load_strategy = 'normal'  
+        if lean:
+            firefox_options.add_argument("-headless")
+            for name, value in BrowserManager.LEAN_PREFERENCES.items():
+                firefox_options.set_preference(name, value)
         return firefox_options
 
     @staticmethod
-    def create_driver() -> webdriver.Firefox:
+    def create_driver(lean: bool = False) -> "webdriver.Firefox":
+        from selenium import webdriver
+
         print("Configuring Firefox settings...")
-        options = BrowserManager.create_firefox_options()
-        print("Starting Firefox...")
+        options = BrowserManager.create_firefox_options(lean)
+        print("Starting Firefox (lean headless mode)..." if lean else "Starting Firefox...")
         return webdriver.Firefox(options=options)
 
     @staticmethod
-    def close_driver(driver: Optional[webdriver.Firefox]) -> None:
+    def _process_tree_peak_rss_kb(root_pid: int) -> Optional[int]:
+        if not os.path.isdir("/proc"):
+            return None
+
+        children = {}
+        for entry in os.listdir("/proc"):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry}/stat") as f:
+                    parent_pid = int(f.read().rsplit(")", 1)[1].split()[1])
+                children.setdefault(parent_pid, []).append(int(entry))
+            except (OSError, ValueError, IndexError):
+                continue
+
+        peak_kb = 0
+        pending = [root_pid]
+        while pending:
+            pid = pending.pop()
+            pending.extend(children.get(pid, []))
+            try:
+                with open(f"/proc/{pid}/status") as f:
+                    for line in f:
+                        if line.startswith("VmHWM:"):
+                            peak_kb += int(line.split()[1])
+                            break
+            except (OSError, ValueError):
+                continue
+        return peak_kb or None
+
+    @staticmethod
+    def get_resource_usage(driver: "webdriver.Firefox") -> dict:
+        usage = {'peak_rss_mb': None, 'page_load_ms': None}
+        try:
+            pid = driver.capabilities.get("moz:processID")
+            peak_kb = BrowserManager._process_tree_peak_rss_kb(pid) if pid else None
+            usage['peak_rss_mb'] = peak_kb / 1024 if peak_kb else None
+        except Exception as e:
+            print(f"Could not read browser memory usage: {str(e)}")
+        try:
+            usage['page_load_ms'] = driver.execute_script(BrowserManager.PAGE_LOAD_TIME_SCRIPT)
+        except Exception as e:
+            print(f"Could not read page load time: {str(e)}")
+        return usage
+
+    @staticmethod
+    def print_resource_usage(driver: Optional["webdriver.Firefox"]) -> None:
+        if not driver:
+            return
+        usage = BrowserManager.get_resource_usage(driver)
+        peak_rss = f"{usage['peak_rss_mb']:.0f} MB" if usage['peak_rss_mb'] else "unavailable"
+        page_load = f"{usage['page_load_ms']:.0f} ms" if usage['page_load_ms'] else "unavailable"
+        print(f"Browser peak RSS: {peak_rss}, last page load: {page_load}")
+
+    @staticmethod
+    def close_driver(driver: Optional["webdriver.Firefox"]) -> None:
         if driver:
             try:
                 driver.quit()
@@ -63,57 +333,502 @@ class BrowserManager:
                 print(f"Error closing browser: {str(e)}")
 
 class LinkedinScraper:
-    def __init__(self, config: ScrapingConfig):
+    def __init__(self, config: ScrapingConfig, seen_index: Optional[SeenProfileIndex] = None,
+                 pacer: Optional[RequestPacer] = None, metrics: Optional[RunMetrics] = None):
         self.config = config
+        self.owns_pacer = pacer is None
+        self.pacer = pacer or self.create_pacer(config)
+        self.owns_metrics = metrics is None
+        self.metrics = metrics or RunMetrics()
+        self.selectors = SelectorRegistry(LinkedinSearch.SELECTOR_CHAINS)
+        self.enricher = None
+        self.page_backend: Optional[PageBackend] = None
         self.driver = None
+        self.logged_in = False
+        self.profile_count = 0
+        self.search_completed = False
+        self.seen_index = seen_index
+        if self.seen_index is None and not config.ignore_seen_index:
+            self.seen_index = SeenProfileIndex()
+
+    @staticmethod
+    def create_pacer(config: ScrapingConfig) -> RequestPacer:
+        return RequestPacer(PacerConfig(
+            rate=config.request_rate,
+            burst=config.request_burst,
+            adaptive=not config.fixed_rate,
+            log_path=config.pacer_log
+        ))
+
+    @staticmethod
+    def export_columns(config: ScrapingConfig) -> Optional[dict]:
+        return ProfileEnricher.DETAIL_COLUMNS if config.enrich_tabs else None
 
     def initialize_browser(self) -> None:
-        self.driver = BrowserManager.create_driver()
+        if self.config.page_backend == "firefox":
+            self.driver = BrowserManager.create_driver(lean=self.config.lean_browser)
+        else:
+            self.page_backend = create_page_backend(self.config.page_backend, self.config.replay_file)
+
+    def create_backend(self, waiter: "PageWaiter") -> PageBackend:
+        return self.page_backend or SeleniumBackend(self.driver, waiter)
+
+    def close(self) -> None:
+        BrowserManager.close_driver(self.driver)
+        if self.page_backend:
+            self.page_backend.close()
+        if self.owns_pacer:
+            self.pacer.close()
+
+    def create_waiter(self) -> "PageWaiter":
+        from page_waiter import PageWaiter, WaitConfig
+
+        return PageWaiter(
+            self.driver,
+            WaitConfig(
+                timeout=self.config.wait_timeout, poll_interval=self.config.poll_interval,
+                stable_period=self.config.stable_period
+            ),
+            metrics=self.metrics
+        )
+
+    def login(self, waiter: "PageWaiter") -> bool:
+        backend = self.create_backend(waiter)
+        if backend.offline:
+            print(f"The {backend.name} backend needs no login.")
+            self.logged_in = True
+            return True
+
+        from login import LinkedinLogin
+
+        print("Login process is starting...")
+        login_manager = LinkedinLogin(
+            self.driver, waiter=waiter, base_url=self.config.base_url, pacer=self.pacer, metrics=self.metrics,
+            backend=backend
+        )
+        self.logged_in = bool(login_manager.login())
+        return self.logged_in
+
+    def session_expired(self) -> bool:
+        try:
+            current_url = self.driver.current_url if self.driver else self.page_backend.current_url
+        except Exception:
+            return True
+        return any(marker in current_url for marker in ("/login", "/authwall", "/checkpoint"))
+
+    def run_scraping_with_relogin(self, log_prefix: str = "") -> Optional[str]:
+        excel_file = self.run_scraping()
+        if not self.profile_count and self.session_expired():
+            from login import LinkedinLogin
+
+            print(f"{log_prefix}Session expired during '{self.config.search_term}', logging in again...")
+            LinkedinLogin(
+                self.driver, base_url=self.config.base_url, pacer=self.pacer, metrics=self.metrics,
+                backend=self.page_backend
+            ).invalidate_session_cache()
+            self.logged_in = False
+            excel_file = self.run_scraping()
+        return excel_file
+
+    def create_enricher(self) -> Optional[ProfileEnricher]:
+        if not self.config.enrich_tabs:
+            return None
+        if not self.enricher or self.enricher.driver is not self.driver:
+            self.enricher = ProfileEnricher(self.driver, self.config.enrich_tabs, pacer=self.pacer, metrics=self.metrics)
+        self.enricher.tabs = self.config.enrich_tabs
+        self.enricher.metrics = self.metrics
+        return self.enricher
+
+    def create_recorder(self) -> Optional[PageRecorder]:
+        if not self.config.record_directory:
+            return None
+        return PageRecorder(
+            self.config.record_directory,
+            search_term=self.config.search_term,
+            base_url=self.config.base_url,
+            extraction_mode=self.config.extraction_mode,
+            selectors=LinkedinSearch.SELECTOR_CHAINS
+        )
+
+    def create_search(self, waiter: "PageWaiter") -> LinkedinSearch:
+        return LinkedinSearch(
+            self.driver,
+            extraction_mode=self.config.extraction_mode,
+            waiter=waiter,
+            base_url=self.config.base_url,
+            seen_index=self.seen_index,
+            pacer=self.pacer,
+            metrics=self.metrics,
+            selectors=self.selectors,
+            enricher=self.create_enricher(),
+            parser_workers=self.config.parser_workers,
+            recorder=self.create_recorder(),
+            backend=self.create_backend(waiter)
+        )
+
+    def load_checkpoint(self) -> SearchCheckpoint:
+        if self.config.resume:
+            checkpoint = load_checkpoint(self.config.search_term, self.config.max_profiles)
+            if checkpoint:
+                print(f"Checkpoint found: page {checkpoint.last_completed_page} completed, "
+                      f"{checkpoint.profile_count} profiles collected, {checkpoint.exported_rows} rows exported")
+                return checkpoint
+            print("No checkpoint found for this search, starting from the first page.")
+        return SearchCheckpoint(self.config.search_term, self.config.max_profiles)
+
+    def write_metrics(self) -> Optional[str]:
+        return self.metrics.write(self.config.report_directory, self.config.prometheus_file)
 
-    def run_scraping(self) -> None:
+    def run_scraping(self, progress_callback: Optional[Callable[[int, int, int], None]] = None,
+                     cancel_event: Optional[threading.Event] = None) -> Optional[str]:
+        if self.owns_metrics:
+            self.metrics = RunMetrics()
+        with self.metrics.span("run"):
+            excel_file = self._run_scraping(progress_callback, cancel_event)
+        if self.owns_metrics:
+            self.write_metrics()
+        return excel_file
+
+    def _run_scraping(self, progress_callback: Optional[Callable[[int, int, int], None]],
+                      cancel_event: Optional[threading.Event]) -> Optional[str]:
+        self.profile_count = 0
+        self.search_completed = False
         try:
             print(f"Search term: {self.config.search_term}")
             print(f"Max profiles: {self.config.max_profiles}")
 
-            print("Login process is starting...")
-            login_manager = LinkedinLogin(self.driver)
-
-            if not login_manager.login():
+            waiter = self.create_waiter()
+            if not self.logged_in and not self.login(waiter):
                 print("Login failed! Please check your credentials.")
-                return
+                return None
 
             print("Search process is starting...")
-            profile_search = LinkedinSearch(self.driver)
-            profiles = profile_search.search_profiles(self.config.search_term, self.config.max_profiles)
+            profile_search = self.create_search(waiter)
+            checkpoint = self.load_checkpoint()
+            excel_creator = ExcelCreator(
+                seen_index=self.seen_index, metrics=self.metrics, extra_columns=self.export_columns(self.config),
+                render=self.config.render_excel
+            )
+            excel_creator.open(self.config.search_term)
+            try:
+                profile_search.search_profiles(
+                    self.config.search_term, self.config.max_profiles, sink=excel_creator, checkpoint=checkpoint,
+                    progress_callback=progress_callback, cancel_event=cancel_event
+                )
+            finally:
+                excel_file = excel_creator.close()
+            self.search_completed = profile_search.search_completed
+            if profile_search.search_completed:
+                checkpoint.clear()
+            else:
+                print(f"Search interrupted. Run again with --resume to continue from page {checkpoint.next_page}.")
+            waiter.stats.print_summary()
+            self.pacer.print_summary()
+            self.selectors.print_summary()
+            if profile_search.enricher:
+                profile_search.enricher.print_summary()
+            if profile_search.recorder:
+                profile_search.recorder.print_summary()
+            BrowserManager.print_resource_usage(self.driver)
 
-            if not profiles or len(profiles) == 0:
+            self.profile_count = profile_search.profile_count
+            if not profile_search.profile_count:
                 print("No profiles found.")
-                return
+                return None
 
-            print(f"\n{len(profiles)} profiles found.")
-            self._export_profiles(profiles)
+            print(f"\n{profile_search.profile_count} profiles found.")
+            if excel_file:
+                print(f"Data successfully exported to {excel_file}")
+            else:
+                print("Failed to export data to Excel")
+            return excel_file
 
         except Exception as e:
             print(f"An error occurred while running the program: {str(e)}")
+            return None
 
-    def _export_profiles(self, profiles: List) -> None:
-        excel_creator = ExcelCreator()
-        excel_file = excel_creator.export_profiles(profiles, self.config.search_term)
+    def cleanup(self) -> None:
+        input("Press Enter to close the browser...")
+        self.close()
+
+@dataclass
+class WorkerShard:
+    worker_id: int
+    start_page: int
+    pages: int
+    max_profiles: int
+
+@dataclass
+class WorkerResult:
+    shard: WorkerShard
+    profiles: ProfileBatch
+    elapsed: float
+    pages_scraped: int
+
+class ScrapingWorkerPool:
+    PROFILES_PER_PAGE = 10
+
+    def __init__(self, config: ScrapingConfig):
+        self.config = config
+        self.seen_index = None if config.ignore_seen_index else SeenProfileIndex()
+        self.pacer = LinkedinScraper.create_pacer(config)
+        self.metrics = RunMetrics()
+        self.page_lock = threading.Lock()
+        self.next_page = 1
+        self.profiles_collected = 0
+        self.profiles_pending = 0
+        self.pages_exhausted = False
+
+    def create_shards(self) -> List[WorkerShard]:
+        total_pages = (self.config.max_profiles + self.PROFILES_PER_PAGE - 1) // self.PROFILES_PER_PAGE
+        worker_count = min(self.config.workers, total_pages)
+        pages_per_worker, extra_pages = divmod(total_pages, worker_count)
+
+        shards = []
+        start_page = 1
+        remaining_profiles = self.config.max_profiles
+        for worker_id in range(worker_count):
+            pages = pages_per_worker + (1 if worker_id < extra_pages else 0)
+            max_profiles = min(pages * self.PROFILES_PER_PAGE, remaining_profiles)
+            shards.append(WorkerShard(worker_id + 1, start_page, pages, max_profiles))
+            start_page += pages
+            remaining_profiles -= max_profiles
+        self.next_page = start_page
+        self.profiles_pending = self.config.max_profiles
+        return shards
+
+    def _claim_pages(self, finished_profiles: int, new_profiles: int, pages_exhausted: bool,
+                     chunk: int) -> Optional[Tuple[int, int, int]]:
+        with self.page_lock:
+            self.profiles_pending -= finished_profiles
+            self.profiles_collected += new_profiles
+            self.pages_exhausted = self.pages_exhausted or pages_exhausted
+            remaining_profiles = self.config.max_profiles - self.profiles_collected - self.profiles_pending
+            if remaining_profiles <= 0 or self.pages_exhausted or not chunk:
+                return None
+            pages = min(chunk, (remaining_profiles + self.PROFILES_PER_PAGE - 1) // self.PROFILES_PER_PAGE)
+            start_page = self.next_page
+            self.next_page += pages
+            self.profiles_pending += remaining_profiles
+            return start_page, start_page + pages - 1, remaining_profiles
+
+    def _run_worker(self, shard: WorkerShard) -> WorkerResult:
+        started = time.perf_counter()
+        pending_profiles = shard.max_profiles
+        profiles = ProfileBatch()
+        scraper = LinkedinScraper(
+            replace(self.config, max_profiles=shard.max_profiles, workers=1),
+            seen_index=self.seen_index,
+            pacer=self.pacer,
+            metrics=self.metrics
+        )
+        try:
+            print(f"[worker {shard.worker_id}] pages {shard.start_page}-{shard.start_page + shard.pages - 1}")
+            scraper.initialize_browser()
+            waiter = scraper.create_waiter()
+            if not scraper.login(waiter):
+                print(f"[worker {shard.worker_id}] Login failed!")
+                return WorkerResult(shard, ProfileBatch(), time.perf_counter() - started, 0)
+
+            profile_search = scraper.create_search(waiter)
+            profiles = profile_search.profiles
+            claim = (shard.start_page, shard.start_page + shard.pages - 1, shard.max_profiles)
+            while claim:
+                start_page, end_page, max_profiles = claim
+                if start_page != shard.start_page:
+                    print(f"[worker {shard.worker_id}] {max_profiles} profiles still missing, taking pages {start_page}-{end_page}")
+                collected = len(profile_search.profiles)
+                profile_search.search_profiles(self.config.search_term, max_profiles, start_page=start_page, end_page=end_page)
+                claim = self._claim_pages(
+                    max_profiles, len(profile_search.profiles) - collected, profile_search.pages_exhausted,
+                    shard.pages if profile_search.search_completed else 0
+                )
+                pending_profiles = claim[2] if claim else 0
+            BrowserManager.print_resource_usage(scraper.driver)
+            return WorkerResult(shard, profiles, time.perf_counter() - started, len(profile_search.page_command_counts))
+        except Exception as e:
+            print(f"[worker {shard.worker_id}] Error: {str(e)}")
+            return WorkerResult(shard, profiles, time.perf_counter() - started, 0)
+        finally:
+            if pending_profiles:
+                self._claim_pages(pending_profiles, 0, False, 0)
+            scraper.close()
+
+    def _print_throughput(self, results: List[WorkerResult]) -> None:
+        print("\nWorker throughput:")
+        for result in results:
+            elapsed = max(result.elapsed, 1e-9)
+            print(
+                f"  worker {result.shard.worker_id}: {len(result.profiles)} profiles, "
+                f"{result.pages_scraped} pages in {result.elapsed:.1f}s "
+                f"({len(result.profiles) / elapsed:.2f} profiles/sec, {result.pages_scraped / elapsed:.2f} pages/sec)"
+            )
+
+    def run_scraping(self) -> Optional[str]:
+        try:
+            return self._run_scraping()
+        finally:
+            self.pacer.close()
+
+    def _run_scraping(self) -> Optional[str]:
+        shards = self.create_shards()
+        print(f"Search term: {self.config.search_term}")
+        print(f"Max profiles: {self.config.max_profiles}")
+        print(f"Starting {len(shards)} browser workers...")
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+            results = list(executor.map(self._run_worker, shards))
+        elapsed = time.perf_counter() - started
+
+        self._print_throughput(results)
+        self.pacer.print_summary()
+        profiles = ProfileBatch()
+        for result in results:
+            profiles.extend(result.profiles)
+        profiles = profiles[:self.config.max_profiles]
+        if len(profiles) < self.config.max_profiles:
+            print(f"\nOnly {len(profiles)} of {self.config.max_profiles} profiles were found.")
+        print(f"\n{len(profiles)} profiles found in {elapsed:.1f}s ({len(profiles) / max(elapsed, 1e-9):.2f} profiles/sec).")
+        if not profiles:
+            print("No profiles found.")
+            self.metrics.write(self.config.report_directory, self.config.prometheus_file)
+            return None
 
+        excel_creator = ExcelCreator(
+            seen_index=self.seen_index, metrics=self.metrics, extra_columns=LinkedinScraper.export_columns(self.config),
+            render=self.config.render_excel
+        )
+        excel_file = excel_creator.export_profiles(profiles, self.config.search_term)
         if excel_file:
             print(f"Data successfully exported to {excel_file}")
         else:
             print("Failed to export data to Excel")
+        self.metrics.write(self.config.report_directory, self.config.prometheus_file)
+        return excel_file
 
-    def cleanup(self) -> None:
-        input("Press Enter to close the browser...")
-        BrowserManager.close_driver(self.driver)
+class BatchJobRunner:
+    def __init__(self, config: ScrapingConfig):
+        self.config = config
+        self.jobs_path = config.jobs_file
+        self.manifest = BatchManifest(manifest_path(config.jobs_file))
+        self.seen_index = None if config.ignore_seen_index else SeenProfileIndex()
+        self.pacer = LinkedinScraper.create_pacer(config)
+        self.metrics = RunMetrics()
+        self.jobs = queue.Queue()
+
+    def _job_config(self, job: BatchJob) -> ScrapingConfig:
+        return replace(
+            self.config, search_term=job.term, max_profiles=job.max_profiles,
+            workers=1, resume=True, jobs_file=None
+        )
+
+    def _run_job(self, scraper: LinkedinScraper, job: BatchJob) -> Optional[str]:
+        scraper.config = self._job_config(job)
+        return scraper.run_scraping_with_relogin("[session] ")
+
+    def _run_session(self, session_id: int) -> int:
+        scraper = LinkedinScraper(replace(self.config, jobs_file=None), seen_index=self.seen_index, pacer=self.pacer,
+                                  metrics=self.metrics)
+        jobs_run = 0
+        try:
+            scraper.initialize_browser()
+            while True:
+                try:
+                    job = self.jobs.get_nowait()
+                except queue.Empty:
+                    break
+
+                print(f"\n[session {session_id}] Job '{job.term}' ({job.max_profiles} profiles, priority {job.priority})")
+                self.manifest.update(job, "running", session=session_id)
+                started = time.perf_counter()
+                try:
+                    excel_file = self._run_job(scraper, job)
+                    error = None
+                except Exception as e:
+                    excel_file = None
+                    error = str(e)
+
+                if scraper.search_completed:
+                    status = "completed"
+                elif scraper.profile_count:
+                    status = "interrupted"
+                else:
+                    status = "failed"
+                self.manifest.update(
+                    job, status, session=session_id, profiles=scraper.profile_count, excel_file=excel_file,
+                    elapsed=round(time.perf_counter() - started, 2), error=error
+                )
+                jobs_run += 1
+        except Exception as e:
+            print(f"[session {session_id}] Error: {str(e)}")
+        finally:
+            scraper.close()
+        return jobs_run
+
+    def run(self) -> None:
+        try:
+            self._run()
+        finally:
+            self.pacer.close()
+
+    def _run(self) -> None:
+        jobs = load_jobs(self.jobs_path)
+        for job in jobs:
+            if self.manifest.is_completed(job):
+                print(f"Skipping completed job '{job.term}' ({job.max_profiles} profiles)")
+                continue
+            self.manifest.update(job, "pending")
+            self.jobs.put(job)
+
+        pending = self.jobs.qsize()
+        if not pending:
+            print("All jobs in the job file are already completed.")
+            return
+
+        session_count = min(self.config.workers, pending)
+        print(f"Running {pending} jobs over {session_count} browser sessions...")
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=session_count) as executor:
+            jobs_run = sum(executor.map(self._run_session, range(1, session_count + 1)))
+
+        elapsed = time.perf_counter() - started
+        summary = ", ".join(f"{count} {status}" for status, count in sorted(self.manifest.summary().items()))
+        print(f"\n{jobs_run} jobs run in {elapsed:.1f}s ({summary}).")
+        print(f"Job manifest written to {self.manifest.path}")
+        self.metrics.write(self.config.report_directory, self.config.prometheus_file)
 
 def main():
     try:
         validator = ArgumentValidator()
+        if validator.wants_help(sys.argv):
+            print(validator.usage())
+            return
         config = validator.validate_args(sys.argv)
 
+        if config.jobs_file:
+            BatchJobRunner(config).run()
+            return
+
+        if config.workers > 1:
+            ScrapingWorkerPool(config).run_scraping()
+            return
+
+        unsupported = unsupported_job_options(config)
+        use_daemon = not config.no_daemon and daemon_available()
+        if use_daemon and unsupported:
+            print(f"The session daemon does not support {', '.join(unsupported)}, starting a new browser instead.")
+        elif use_daemon:
+            print("Submitting search to the running session daemon...")
+            response = submit_job(config)
+            if response and response.get("status") == "ok":
+                print(f"{response['profiles']} profiles found in {response['elapsed']:.1f}s.")
+                if response.get("excel_file"):
+                    print(f"Data successfully exported to {response['excel_file']}")
+            else:
+                print(f"Session daemon job failed: {(response or {}).get('error', 'no response')}")
+            return
+
         scraper = LinkedinScraper(config)
         scraper.initialize_browser()
         scraper.run_scraping()
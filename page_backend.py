@@ -0,0 +1,258 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qs, urljoin, urlparse
+from selector_registry import Selector, SelectorRegistry
+
+class PageBackend:
+    name = "base"
+    driver = None
+    offline = False
+
+    def __init__(self):
+        self._page_source = ""
+        self._current_url = ""
+        self._parser = None
+        self._card_parser = None
+        self._parsed = None
+
+    def execute(self, command: str, params: Optional[dict] = None):
+        return getattr(self, f"_{command}")(**(params or {}))
+
+    @property
+    def current_url(self) -> str:
+        return self._current_url
+
+    def navigate(self, url: str) -> None:
+        self.execute("navigate", {"url": url})
+
+    def wait_until_ready(self) -> bool:
+        return bool(self._page_source)
+
+    def snapshot(self) -> Tuple[str, str]:
+        return self.execute("snapshot")
+
+    def _snapshot(self) -> Tuple[str, str]:
+        return self._page_source, self._current_url
+
+    def _document(self):
+        if self._parsed is None or self._parsed[0] is not self._page_source:
+            from lxml import html as lxml_html
+            from html_profile_parser import HtmlProfileParser
+
+            if self._parser is None:
+                self._parser = HtmlProfileParser(())
+            document = lxml_html.fromstring(self._page_source).getroottree() if self._page_source else None
+            self._parsed = (self._page_source, document)
+        return self._parsed[1]
+
+    def _find_first_chain_match(self, chain: Sequence[Selector]) -> Tuple[list, int]:
+        document = self._document()
+        if document is None:
+            return [], -1
+        for index, selector in enumerate(chain):
+            matches = self._parser.find_all(document, selector)
+            if matches:
+                return matches, index
+        return [], -1
+
+    def count(self, chain: Sequence[Selector]) -> int:
+        return len(self._find_first_chain_match(chain)[0])
+
+    def render(self, chain: Sequence[Selector], expected: int) -> int:
+        return self.count(chain)
+
+    def query_cards(self, chains: Dict[str, List[Selector]], fields: Sequence[str], limit: int) -> dict:
+        return self.execute("query_cards", {"chains": chains, "fields": fields, "limit": limit})
+
+    def _query_cards(self, chains: Dict[str, List[Selector]], fields: Sequence[str], limit: int) -> dict:
+        if self._card_parser is None or self._card_parser.fields != tuple(fields):
+            from html_profile_parser import HtmlProfileParser
+
+            self._card_parser = HtmlProfileParser(fields)
+        return self._card_parser.parse_cards(self._page_source, chains, self._current_url, limit)
+
+    def find_next_link(self, chain: Sequence[Selector]) -> Tuple[int, Optional[str]]:
+        matches, index = self._find_first_chain_match(chain)
+        if not matches or matches[0].get("disabled") is not None:
+            return index, None
+        href = matches[0].get("href")
+        return index, urljoin(self._current_url, href) if href else None
+
+    def get_cookies(self) -> List[dict]:
+        return []
+
+    def add_cookies(self, cookies: List[dict]) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+class SeleniumBackend(PageBackend):
+    name = "firefox"
+    CARDS_SCRIPT = SelectorRegistry.FIND_SCRIPT + """
+        const [chains, fields, count] = arguments;
+        const text = (node) => node ? (node.innerText || node.textContent || '').trim() : null;
+        let bases = [];
+        let cardHit = -1;
+        for (let index = 0; index < chains.card.length; index++) {
+            bases = findAll(chains.card[index]);
+            if (bases.length) {
+                cardHit = index;
+                break;
+            }
+        }
+        const cards = bases.slice(0, count).map((base) => {
+            const card = {hits: {}};
+            for (const field of fields) {
+                const [node, hit] = lookup(chains[field], base);
+                card.hits[field] = hit;
+                card[field] = field === 'profile_link'
+                    ? (node ? (node.href || node.getAttribute('href') || '') : null)
+                    : text(node);
+            }
+            return card;
+        });
+        return {card_hit: cardHit, cards: cards};
+    """
+
+    def __init__(self, driver, waiter=None):
+        super().__init__()
+        from page_waiter import PageWaiter
+
+        self.driver = driver
+        self.waiter = waiter or PageWaiter(driver)
+
+    @property
+    def current_url(self) -> str:
+        return self.driver.current_url
+
+    def navigate(self, url: str) -> None:
+        self.driver.get(url)
+
+    def wait_until_ready(self) -> bool:
+        return self.waiter.wait_for_ready_state()
+
+    def snapshot(self) -> Tuple[str, str]:
+        return self.driver.page_source, self.driver.current_url
+
+    def count(self, chain: Sequence[Selector]) -> int:
+        return self.waiter.wait_for_stable_count(chain, expected=1)
+
+    def render(self, chain: Sequence[Selector], expected: int) -> int:
+        return self.waiter.wait_for_rendered_count(chain, expected)
+
+    def query_cards(self, chains: Dict[str, List[Selector]], fields: Sequence[str], limit: int) -> dict:
+        script_chains = {field: [selector.to_script() for selector in chain] for field, chain in chains.items()}
+        return self.driver.execute_script(self.CARDS_SCRIPT, script_chains, list(fields), limit)
+
+    def find_next_link(self, chain: Sequence[Selector]) -> Tuple[int, Optional[str]]:
+        self._page_source, self._current_url = self.snapshot()
+        return super().find_next_link(chain)
+
+    def get_cookies(self) -> List[dict]:
+        return self.driver.get_cookies()
+
+    def add_cookies(self, cookies: List[dict]) -> None:
+        for cookie in cookies:
+            try:
+                if 'expiry' in cookie and isinstance(cookie['expiry'], float):
+                    cookie['expiry'] = int(cookie['expiry'])
+                self.driver.add_cookie(cookie)
+            except Exception as e:
+                print(f"Error adding cookie: {str(e)}")
+
+    def close(self) -> None:
+        self.driver.quit()
+
+class HttpBackend(PageBackend):
+    name = "http"
+    USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64; rv:128.0) Gecko/20100101 Firefox/128.0"
+
+    def __init__(self, pool_size: int = 10, timeout: float = 20.0, user_agent: str = USER_AGENT):
+        super().__init__()
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.timeout = timeout
+        self.status_code = None
+        self.session = requests.Session()
+        self.session.headers.update({
+            "User-Agent": user_agent,
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.5"
+        })
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _navigate(self, url: str) -> None:
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+        except Exception as e:
+            print(f"Request to {url} failed: {str(e)}")
+            self.status_code, self._page_source, self._current_url = None, "", url
+            return
+        self.status_code = response.status_code
+        self._page_source = response.text
+        self._current_url = response.url
+
+    def wait_until_ready(self) -> bool:
+        return self.status_code is not None and self.status_code < 400
+
+    def get_cookies(self) -> List[dict]:
+        cookies = []
+        for cookie in self.session.cookies:
+            values = {"name": cookie.name, "value": cookie.value, "domain": cookie.domain, "path": cookie.path,
+                      "secure": cookie.secure}
+            if cookie.expires:
+                values["expiry"] = cookie.expires
+            cookies.append(values)
+        return cookies
+
+    def add_cookies(self, cookies: List[dict]) -> None:
+        for cookie in cookies:
+            self.session.cookies.set(
+                cookie["name"], cookie["value"], domain=cookie.get("domain", ""), path=cookie.get("path", "/"),
+                secure=cookie.get("secure", False), expires=cookie.get("expiry")
+            )
+
+    def close(self) -> None:
+        self.session.close()
+
+class ReplayBackend(PageBackend):
+    name = "replay"
+    offline = True
+
+    def __init__(self, recording):
+        super().__init__()
+        self.recording = recording
+        self.pages = {}
+        for recorded in recording.pages:
+            self.pages.setdefault(self._page_key(recorded.url), recorded)
+        self._sources = {}
+
+    @staticmethod
+    def _page_key(url: str) -> tuple:
+        parsed = urlparse(url)
+        query = parse_qs(parsed.query)
+        return parsed.path.rstrip("/"), tuple(query.get("keywords", [])), tuple(query.get("page", ["1"]))
+
+    def _navigate(self, url: str) -> None:
+        recorded = self.pages.get(self._page_key(url))
+        self._current_url = url
+        if not recorded:
+            self._page_source = ""
+            return
+        if recorded.sha256 not in self._sources:
+            self._sources[recorded.sha256] = self.recording.read_page(recorded)
+        self._page_source = self._sources[recorded.sha256]
+
+def create_page_backend(name: str, recording_path: Optional[str] = None) -> PageBackend:
+    if name == "http":
+        return HttpBackend()
+    if name == "replay":
+        from page_recorder import load_recording
+
+        recording = load_recording(recording_path)
+        print(f"Replaying {len(recording.pages)} recorded pages from {recording_path}")
+        return ReplayBackend(recording)
+    raise ValueError(f"Unknown page backend: {name}")
@@ -0,0 +1,150 @@
+import gzip
+import hashlib
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+
+RECORDING_DIRECTORY = "recordings"
+
+@dataclass
+class RecordedPage:
+    page: int
+    url: str
+    sha256: str
+    size: int
+    captured_at: str
+    profiles: Optional[int] = None
+
+@dataclass
+class Recording:
+    run_id: str
+    started_at: str
+    search_term: str = ""
+    base_url: str = ""
+    extraction_mode: str = ""
+    selectors: Dict[str, List[str]] = field(default_factory=dict)
+    pages: List[RecordedPage] = field(default_factory=list)
+    directory: str = field(default=RECORDING_DIRECTORY, repr=False, compare=False)
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.directory, "runs", f"{self.run_id}.json")
+
+    @property
+    def pages_path(self) -> str:
+        return os.path.join(self.directory, "runs", f"{self.run_id}.pages.jsonl")
+
+    def page_path(self, sha256: str) -> str:
+        return os.path.join(self.directory, "pages", sha256[:2], f"{sha256}.html.gz")
+
+    def read_page(self, page: RecordedPage) -> str:
+        with gzip.open(self.page_path(page.sha256), "rb") as f:
+            return f.read().decode("utf-8")
+
+    def save(self) -> None:
+        data = asdict(self)
+        data.pop("directory")
+        data.pop("pages")
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        temporary_path = f"{self.path}.tmp"
+        with open(temporary_path, "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(temporary_path, self.path)
+
+def load_recording(path: str) -> Recording:
+    with open(path) as f:
+        data = json.load(f)
+    directory = os.path.dirname(os.path.dirname(os.path.abspath(path)))
+    recording = Recording(directory=directory, **data)
+
+    if os.path.exists(recording.pages_path):
+        with open(recording.pages_path) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                event = json.loads(line)
+                if event.pop("event") == "page":
+                    recording.pages.append(RecordedPage(**event))
+                    continue
+                for recorded in reversed(recording.pages):
+                    if recorded.page == event["page"]:
+                        recorded.profiles = event["profiles"]
+                        break
+    return recording
+
+class PageRecorder:
+    def __init__(self, directory: str = RECORDING_DIRECTORY, search_term: str = "", base_url: str = "",
+                 extraction_mode: str = "", selectors: Optional[Dict[str, list]] = None):
+        started = datetime.now()
+        self.recording = Recording(
+            run_id=started.strftime("%Y%m%d_%H%M%S_%f"),
+            started_at=started.isoformat(timespec="seconds"),
+            search_term=search_term,
+            base_url=base_url,
+            extraction_mode=extraction_mode,
+            selectors={name: [selector.label for selector in chain] for name, chain in (selectors or {}).items()},
+            directory=directory
+        )
+        self.bytes_written = 0
+        self._lock = threading.Lock()
+        self._started = False
+
+    def _store(self, content: bytes) -> str:
+        sha256 = hashlib.sha256(content).hexdigest()
+        page_path = self.recording.page_path(sha256)
+        if not os.path.exists(page_path):
+            os.makedirs(os.path.dirname(page_path), exist_ok=True)
+            temporary_path = f"{page_path}.{threading.get_ident()}.tmp"
+            with open(temporary_path, "wb") as f:
+                with gzip.GzipFile(fileobj=f, mode="wb", mtime=0) as compressed:
+                    compressed.write(content)
+            os.replace(temporary_path, page_path)
+            self.bytes_written += os.path.getsize(page_path)
+        return sha256
+
+    def _append_event(self, event: dict) -> None:
+        if not self._started:
+            self.recording.save()
+            self._started = True
+        with open(self.recording.pages_path, "a") as f:
+            f.write(json.dumps(event) + "\n")
+
+    def record(self, page: int, page_source: str, page_url: str) -> None:
+        try:
+            content = (page_source or "").encode("utf-8")
+            sha256 = self._store(content)
+            recorded = RecordedPage(
+                page=page, url=page_url, sha256=sha256, size=len(content),
+                captured_at=datetime.now().isoformat(timespec="seconds")
+            )
+            with self._lock:
+                self.recording.pages.append(recorded)
+                self._append_event({"event": "page", **asdict(recorded)})
+        except OSError as e:
+            print(f"Could not record page {page}: {str(e)}")
+
+    def record_profiles(self, page: int, profiles: int) -> None:
+        with self._lock:
+            for recorded in reversed(self.recording.pages):
+                if recorded.page == page:
+                    recorded.profiles = profiles
+                    break
+            else:
+                return
+            try:
+                self._append_event({"event": "profiles", "page": page, "profiles": profiles})
+            except OSError as e:
+                print(f"Could not update recording {self.recording.path}: {str(e)}")
+
+    def print_summary(self) -> None:
+        pages = self.recording.pages
+        if not pages:
+            return
+        unique = len({page.sha256 for page in pages})
+        print(
+            f"\nRecorded {len(pages)} pages ({unique} unique, {self.bytes_written / 1024:.0f} KiB compressed) "
+            f"to {self.recording.path}"
+        )
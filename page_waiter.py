@@ -0,0 +1,212 @@
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+import time
+from run_metrics import RunMetrics
+from selector_registry import Selector, SelectorRegistry, xpath
+
+@dataclass
+class WaitConfig:
+    timeout: float = 10.0
+    poll_interval: float = 0.1
+    stable_period: float = 0.5
+
+class WaitStats:
+    def __init__(self):
+        self.records: Dict[str, List[Tuple[float, bool]]] = {}
+
+    def record(self, name: str, elapsed: float, succeeded: bool) -> None:
+        self.records.setdefault(name, []).append((elapsed, succeeded))
+
+    def summary(self) -> Dict[str, dict]:
+        summary = {}
+        for name, records in self.records.items():
+            durations = [elapsed for elapsed, _ in records]
+            summary[name] = {
+                'count': len(records),
+                'timeouts': sum(1 for _, succeeded in records if not succeeded),
+                'total': sum(durations),
+                'average': sum(durations) / len(durations),
+                'max': max(durations)
+            }
+        return summary
+
+    def print_summary(self) -> None:
+        summary = self.summary()
+        if not summary:
+            return
+        print("\nWait statistics:")
+        for name, stats in sorted(summary.items()):
+            print(
+                f"  {name}: {stats['count']} waits, {stats['timeouts']} timeouts, "
+                f"avg {stats['average']:.2f}s, max {stats['max']:.2f}s, total {stats['total']:.2f}s"
+            )
+
+class PageWaiter:
+    READY_STATE_SCRIPT = "return document.readyState"
+    RENDERED_COUNT_SCRIPT = SelectorRegistry.FIND_SCRIPT + """
+        const [selectors, expected, timeoutMs, stableMs] = arguments;
+        const done = arguments[arguments.length - 1];
+        const items = () => {
+            for (const selector of selectors) {
+                const nodes = findAll(selector);
+                if (nodes.length) {
+                    return nodes;
+                }
+            }
+            return [];
+        };
+        let finished = false;
+        let lastCount = -1;
+        let stableTimer = null;
+        const finish = (reason) => {
+            if (finished) {
+                return;
+            }
+            finished = true;
+            observer.disconnect();
+            clearTimeout(stableTimer);
+            clearTimeout(deadline);
+            done([items().length, reason]);
+        };
+        const check = () => {
+            if (finished) {
+                return;
+            }
+            const nodes = items();
+            if (nodes.length >= expected) {
+                finish('rendered');
+                return;
+            }
+            if (nodes.length !== lastCount) {
+                lastCount = nodes.length;
+                if (nodes.length) {
+                    nodes[nodes.length - 1].scrollIntoView({block: 'end'});
+                }
+                window.scrollTo(0, document.body.scrollHeight);
+                clearTimeout(stableTimer);
+                if (nodes.length) {
+                    stableTimer = setTimeout(() => finish('stable'), stableMs);
+                }
+            }
+        };
+        const observer = new MutationObserver(check);
+        observer.observe(document.body, {childList: true, subtree: true});
+        const deadline = setTimeout(() => finish('timeout'), timeoutMs);
+        window.scrollTo(0, document.body.scrollHeight / 2);
+        check();
+    """
+    PAGINATION_STATE_SCRIPT = SelectorRegistry.FIND_SCRIPT + """
+        const [first] = lookup(arguments[0]);
+        return [window.location.href, first ? (first.innerText || first.textContent || '').trim() : ''];
+    """
+
+    def __init__(self, driver, config: Optional[WaitConfig] = None, stats: Optional[WaitStats] = None,
+                 metrics: Optional[RunMetrics] = None):
+        self.driver = driver
+        self.config = config or WaitConfig()
+        self.stats = stats or WaitStats()
+        self.metrics = metrics or RunMetrics()
+        self._script_timeout = None
+
+    def _until(self, name: str, condition: Callable, timeout: Optional[float] = None):
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        timeout = self.config.timeout if timeout is None else timeout
+        started = time.perf_counter()
+        try:
+            result = WebDriverWait(self.driver, timeout, poll_frequency=self.config.poll_interval).until(condition)
+            elapsed = time.perf_counter() - started
+            self.stats.record(name, elapsed, True)
+            self.metrics.observe(f"wait_{name}", elapsed)
+            return result
+        except TimeoutException:
+            elapsed = time.perf_counter() - started
+            self.stats.record(name, elapsed, False)
+            self.metrics.observe(f"wait_{name}", elapsed)
+            self.metrics.increment("timeouts")
+            return None
+
+    def wait_for_ready_state(self, timeout: Optional[float] = None) -> bool:
+        return bool(self._until(
+            "ready_state",
+            lambda driver: driver.execute_script(self.READY_STATE_SCRIPT) == "complete",
+            timeout
+        ))
+
+    def wait_for_url_change(self, previous_url: str, timeout: Optional[float] = None) -> bool:
+        return bool(self._until("url_change", lambda driver: driver.current_url != previous_url, timeout))
+
+    def wait_for_url_match(self, predicate: Callable[[str], bool], timeout: Optional[float] = None) -> bool:
+        return bool(self._until("url_match", lambda driver: predicate(driver.current_url), timeout))
+
+    def wait_for_element(self, by, value, timeout: Optional[float] = None, visible: bool = False):
+        from selenium.webdriver.support import expected_conditions as EC
+
+        condition = EC.visibility_of_element_located if visible else EC.presence_of_element_located
+        return self._until("element", condition((by, value)), timeout)
+
+    @staticmethod
+    def _selector_arguments(target: Union[str, Sequence[Selector]]) -> List[dict]:
+        selectors = [xpath(target)] if isinstance(target, str) else target
+        return [selector.to_script() for selector in selectors]
+
+    def count_elements(self, target: Union[str, Sequence[Selector]]) -> int:
+        return self.driver.execute_script(SelectorRegistry.COUNT_SCRIPT, self._selector_arguments(target)) or 0
+
+    def wait_for_stable_count(self, target: Union[str, Sequence[Selector]], expected: Optional[int] = None,
+                              timeout: Optional[float] = None) -> int:
+        state = {'count': -1, 'since': time.perf_counter()}
+
+        def _count_settled(driver):
+            count = self.count_elements(target)
+            now = time.perf_counter()
+            if count != state['count']:
+                state['count'], state['since'] = count, now
+            if expected is not None and count >= expected:
+                return True
+            return count > 0 and now - state['since'] >= self.config.stable_period
+
+        self._until("stable_count", _count_settled, timeout)
+        return max(state['count'], 0)
+
+    def wait_for_rendered_count(self, target: Union[str, Sequence[Selector]], expected: int,
+                                timeout: Optional[float] = None) -> int:
+        timeout = self.config.timeout if timeout is None else timeout
+        if self._script_timeout != timeout + 1:
+            self.driver.set_script_timeout(timeout + 1)
+            self._script_timeout = timeout + 1
+
+        started = time.perf_counter()
+        try:
+            count, reason = self.driver.execute_async_script(
+                self.RENDERED_COUNT_SCRIPT, self._selector_arguments(target), expected,
+                int(timeout * 1000), int(self.config.stable_period * 1000)
+            )
+        except Exception as e:
+            print(f"Render observer failed, polling instead: {str(e)}")
+            return self.wait_for_stable_count(target, expected=expected, timeout=timeout)
+
+        elapsed = time.perf_counter() - started
+        self.stats.record("rendered_count", elapsed, reason != "timeout")
+        self.metrics.observe("wait_rendered_count", elapsed)
+        if reason == "timeout":
+            self.metrics.increment("timeouts")
+        return count
+
+    def pagination_state(self, first_item: Union[str, Sequence[Selector]]) -> Tuple[str, str]:
+        try:
+            url, first_text = self.driver.execute_script(
+                self.PAGINATION_STATE_SCRIPT, self._selector_arguments(first_item)
+            )
+            return url, first_text
+        except Exception:
+            return self.driver.current_url, ""
+
+    def wait_for_pagination_change(self, previous_state: Tuple[str, str], first_item: Union[str, Sequence[Selector]],
+                                   timeout: Optional[float] = None) -> bool:
+        def _changed(driver):
+            url, first_text = self.pagination_state(first_item)
+            return bool(first_text) and (url, first_text) != previous_state
+
+        return bool(self._until("pagination_change", _changed, timeout))
@@ -0,0 +1,74 @@
+from typing import Dict, Iterable, Optional
+
+class LinkedinProfile:
+    __slots__ = ("name", "title", "location", "summary", "connections", "profile_link")
+
+    def __init__(self, name="", title="", location="", summary="", connections="", profile_link=""):
+        self.name = name
+        self.title = title
+        self.location = location
+        self.summary = summary
+        self.connections = connections
+        self.profile_link = profile_link
+
+class ProfileBatch:
+    FIELDS = LinkedinProfile.__slots__
+    __slots__ = ("columns",)
+
+    def __init__(self, columns: Optional[Dict[str, list]] = None):
+        self.columns = columns if columns is not None else {field: [] for field in self.FIELDS}
+
+    @classmethod
+    def from_profiles(cls, profiles: Iterable) -> "ProfileBatch":
+        if isinstance(profiles, ProfileBatch):
+            return cls({field: list(values) for field, values in profiles.columns.items()})
+        batch = cls()
+        batch.extend(profiles)
+        return batch
+
+    def __len__(self) -> int:
+        return len(self.columns[self.FIELDS[0]])
+
+    def __iter__(self):
+        for values in zip(*(self.columns[field] for field in self.FIELDS)):
+            yield LinkedinProfile(*values)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ProfileBatch({field: values[index] for field, values in self.columns.items()})
+        return LinkedinProfile(*(self.columns[field][index] for field in self.FIELDS))
+
+    def append(self, profile) -> None:
+        for field, values in self.columns.items():
+            values.append(getattr(profile, field, ""))
+
+    def append_values(self, **values) -> None:
+        for field, column in self.columns.items():
+            column.append(values.get(field, ""))
+
+    def set_column(self, field: str, values: list) -> None:
+        if len(values) != len(self):
+            raise ValueError(f"Column {field} has {len(values)} values for {len(self)} profiles")
+        self.columns[field] = list(values)
+
+    def take(self, indices: Iterable[int]) -> "ProfileBatch":
+        indices = list(indices)
+        return ProfileBatch({field: [values[index] for index in indices] for field, values in self.columns.items()})
+
+    def extend(self, profiles: Iterable) -> None:
+        if isinstance(profiles, ProfileBatch):
+            count, added = len(self), len(profiles)
+            for field in profiles.columns:
+                self.columns.setdefault(field, [""] * count)
+            for field, values in self.columns.items():
+                values.extend(profiles.columns.get(field, [""] * added))
+            return
+        for profile in profiles:
+            self.append(profile)
+
+    def to_dataframe(self, column_names: Optional[Dict[str, str]] = None):
+        import pandas as pd
+
+        column_names = column_names or {field: field for field in self.FIELDS}
+        empty = [""] * len(self)
+        return pd.DataFrame({label: self.columns.get(field, empty) for field, label in column_names.items()})
@@ -0,0 +1,142 @@
+from collections import deque
+from typing import Dict, List, Optional
+import time
+from profile_batch import ProfileBatch
+from request_pacer import RequestPacer
+from run_metrics import RunMetrics
+
+class ProfileEnricher:
+    DETAIL_COLUMNS = {"experience": "Experience", "education": "Education"}
+    ENTRY_SEPARATOR = " | "
+    DETAILS_SCRIPT = """
+        const [previousUrl, graceExpired, limit] = arguments;
+        if (document.readyState !== 'complete' || window.location.href === previousUrl) {
+            return null;
+        }
+        const section = (id) => {
+            const anchor = document.getElementById(id);
+            return anchor ? (anchor.closest('section') || anchor.parentElement) : null;
+        };
+        const experience = section('experience');
+        const education = section('education');
+        if (!experience && !education && !graceExpired) {
+            return null;
+        }
+        const entries = (container) => container ? Array.from(container.querySelectorAll('li.artdeco-list__item'))
+            .slice(0, limit)
+            .map((item) => Array.from(item.querySelectorAll("span[aria-hidden='true']"))
+                .map((node) => (node.textContent || '').trim())
+                .filter(Boolean)
+                .slice(0, 3)
+                .join(' - '))
+            .filter(Boolean) : null;
+        return {url: window.location.href, experience: entries(experience), education: entries(education)};
+    """
+
+    def __init__(self, driver, tabs: int = 3, pacer: Optional[RequestPacer] = None,
+                 metrics: Optional[RunMetrics] = None, page_timeout: float = 20.0, grace_period: float = 3.0,
+                 poll_interval: float = 0.1, max_entries: int = 5):
+        self.driver = driver
+        self.tabs = max(tabs, 1)
+        self.pacer = pacer or RequestPacer()
+        self.metrics = metrics or RunMetrics()
+        self.page_timeout = page_timeout
+        self.grace_period = grace_period
+        self.poll_interval = poll_interval
+        self.max_entries = max_entries
+        self.home_handle = None
+        self.tab_handles: List[str] = []
+        self.latencies: List[float] = []
+        self.timeouts = 0
+
+    @staticmethod
+    def _is_profile_link(link: str) -> bool:
+        return bool(link) and link.startswith(("http://", "https://"))
+
+    def _open_tabs(self) -> None:
+        self.home_handle = self.driver.current_window_handle
+        open_handles = set(self.driver.window_handles)
+        self.tab_handles = [handle for handle in self.tab_handles if handle in open_handles]
+        while len(self.tab_handles) < self.tabs:
+            self.driver.switch_to.new_window("tab")
+            self.tab_handles.append(self.driver.current_window_handle)
+
+    def _start(self, handle: str, link: str) -> tuple:
+        self.driver.switch_to.window(handle)
+        previous_url = self.driver.current_url
+        self.pacer.acquire("profile page")
+        self.driver.execute_script("window.location.assign(arguments[0]);", link)
+        return previous_url, time.perf_counter()
+
+    def _poll(self, handle: str, previous_url: str, started: float) -> Optional[dict]:
+        self.driver.switch_to.window(handle)
+        grace_expired = time.perf_counter() - started >= self.grace_period
+        return self.driver.execute_script(self.DETAILS_SCRIPT, previous_url, grace_expired, self.max_entries)
+
+    def _finish(self, details: Dict[str, list], index: int, result: Optional[dict], elapsed: float) -> None:
+        self.latencies.append(elapsed)
+        self.metrics.observe("enrich_profile", elapsed)
+        if result is None:
+            self.timeouts += 1
+            self.metrics.increment("enrich_timeouts")
+            self.pacer.record("profile page", elapsed, "error")
+            return
+
+        found = False
+        for field in self.DETAIL_COLUMNS:
+            entries = result.get(field)
+            if entries:
+                details[field][index] = self.ENTRY_SEPARATOR.join(entries)
+                found = True
+        self.metrics.increment("profiles_enriched")
+        self.pacer.record("profile page", elapsed, "ok" if found else "empty")
+
+    def enrich(self, profiles: ProfileBatch) -> ProfileBatch:
+        if not len(profiles):
+            return profiles
+
+        details = {field: ["N/A"] * len(profiles) for field in self.DETAIL_COLUMNS}
+        links = profiles.columns["profile_link"]
+        pending = deque(index for index, link in enumerate(links) if self._is_profile_link(link))
+        in_flight = {}
+        print(f"Enriching {len(pending)} profiles across {self.tabs} tabs...")
+
+        with self.metrics.span("enrichment"):
+            try:
+                self._open_tabs()
+                while pending or in_flight:
+                    for handle in self.tab_handles:
+                        if handle not in in_flight and pending:
+                            index = pending.popleft()
+                            in_flight[handle] = (index, *self._start(handle, links[index]))
+
+                    completed = False
+                    for handle, (index, previous_url, started) in list(in_flight.items()):
+                        result = self._poll(handle, previous_url, started)
+                        elapsed = time.perf_counter() - started
+                        if result is not None or elapsed >= self.page_timeout:
+                            self._finish(details, index, result, elapsed)
+                            del in_flight[handle]
+                            completed = True
+                    if not completed:
+                        time.sleep(self.poll_interval)
+            except Exception as e:
+                print(f"Error during profile enrichment: {str(e)}")
+            finally:
+                if self.home_handle:
+                    self.driver.switch_to.window(self.home_handle)
+
+        for field, values in details.items():
+            profiles.set_column(field, values)
+        return profiles
+
+    def print_summary(self) -> None:
+        if not self.latencies:
+            return
+        ordered = sorted(self.latencies)
+        p50 = ordered[len(ordered) // 2]
+        p95 = ordered[min(len(ordered) - 1, round(0.95 * (len(ordered) - 1)))]
+        print(
+            f"\nProfile enrichment: {len(ordered)} profiles, {self.timeouts} timeouts, "
+            f"p50 {p50:.2f}s, p95 {p95:.2f}s, max {ordered[-1]:.2f}s per profile"
+        )
@@ -0,0 +1,80 @@
+import os
+import sqlite3
+import threading
+from typing import Iterable, List, Optional
+from urllib.parse import urlsplit
+
+def _normalize_text(value: str) -> str:
+    return " ".join((value or "").lower().split())
+
+def normalize_profile_link(profile_link: str) -> Optional[str]:
+    if not profile_link or profile_link == "N/A" or profile_link.isspace():
+        return None
+    path = urlsplit(profile_link.strip()).path.rstrip("/").lower()
+    return f"link:{path}" if path else None
+
+def profile_key(profile) -> Optional[str]:
+    link_key = normalize_profile_link(getattr(profile, "profile_link", ""))
+    if link_key:
+        return link_key
+
+    fields = [_normalize_text(getattr(profile, field, "")) for field in ("name", "title", "location")]
+    if all(not field or field == "n/a" for field in fields):
+        return None
+    return "profile:" + "|".join(fields)
+
+class SeenProfileIndex:
+    def __init__(self, path: str = os.path.join("profile_index", "seen_profiles.sqlite3")):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS seen_profiles (key TEXT PRIMARY KEY) WITHOUT ROWID"
+        )
+        self._connection.commit()
+
+    def contains(self, key: Optional[str]) -> bool:
+        if not key:
+            return False
+        with self._lock:
+            row = self._connection.execute("SELECT 1 FROM seen_profiles WHERE key = ?", (key,)).fetchone()
+        return row is not None
+
+    def contains_profile(self, profile) -> bool:
+        return self.contains(profile_key(profile))
+
+    def add_keys(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO seen_profiles (key) VALUES (?)", ((key,) for key in keys if key)
+            )
+            self._connection.commit()
+
+    def filter_new(self, profiles: List) -> List:
+        new_profiles = []
+        with self._lock:
+            batch_keys = set()
+            for profile in profiles:
+                key = profile_key(profile)
+                if key:
+                    if key in batch_keys:
+                        continue
+                    if self._connection.execute("SELECT 1 FROM seen_profiles WHERE key = ?", (key,)).fetchone():
+                        continue
+                    batch_keys.add(key)
+                new_profiles.append(profile)
+
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO seen_profiles (key) VALUES (?)", ((key,) for key in batch_keys)
+            )
+            self._connection.commit()
+        return new_profiles
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,165 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+from urllib.parse import urljoin
+import contextlib
+import io
+import time
+from lxml import html as lxml_html
+from html_profile_parser import HtmlProfileParser
+from linkedin_profile_search import LinkedinSearch
+from page_recorder import Recording
+from profile_batch import ProfileBatch
+from run_metrics import RunMetrics
+from selector_registry import Selector
+
+class ReplayElement:
+    __slots__ = ("driver", "node")
+
+    def __init__(self, driver, node):
+        self.driver = driver
+        self.node = node
+
+    @property
+    def text(self) -> str:
+        return self.driver.execute("getElementText", {"node": self.node})
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        return self.driver.execute("getElementAttribute", {"node": self.node, "name": name})
+
+    def is_enabled(self) -> bool:
+        return self.get_attribute("disabled") is None
+
+    def find_elements(self, by: str, value: str) -> List["ReplayElement"]:
+        return self.driver.execute("findChildElements", {"node": self.node, "using": by, "value": value})
+
+    def find_element(self, by: str, value: str) -> "ReplayElement":
+        elements = self.find_elements(by, value)
+        if not elements:
+            from selenium.common.exceptions import NoSuchElementException
+            raise NoSuchElementException(f"No element matches {by}: {value}")
+        return elements[0]
+
+class ReplayDriver:
+    SELECTOR_KINDS = {"css selector": "css", "xpath": "xpath"}
+    URL_ATTRIBUTES = ("href", "src")
+
+    def __init__(self):
+        self.parser = HtmlProfileParser(())
+        self.document = None
+        self._page_source = ""
+        self._current_url = ""
+        self._commands = {
+            "getPageSource": lambda params: self._page_source,
+            "getCurrentUrl": lambda params: self._current_url,
+            "findElements": lambda params: self._find(self.document, params),
+            "findChildElements": lambda params: self._find(params["node"], params),
+            "getElementText": lambda params: " ".join(params["node"].text_content().split()),
+            "getElementAttribute": self._attribute
+        }
+
+    def load(self, page_source: str, page_url: str = "") -> None:
+        self._page_source = page_source or ""
+        self._current_url = page_url
+        self.document = lxml_html.fromstring(self._page_source).getroottree() if self._page_source else None
+
+    def execute(self, driver_command: str, params: Optional[dict] = None):
+        command = self._commands.get(driver_command)
+        if not command:
+            from selenium.common.exceptions import WebDriverException
+            raise WebDriverException(f"Replay driver does not support {driver_command}")
+        return command(params or {})
+
+    def _find(self, context, params: dict) -> List[ReplayElement]:
+        if context is None:
+            return []
+        selector = Selector("replay", self.SELECTOR_KINDS[params["using"]], params["value"])
+        return [ReplayElement(self, node) for node in self.parser.find_all(context, selector)]
+
+    def _attribute(self, params: dict) -> Optional[str]:
+        value = params["node"].get(params["name"])
+        if value is not None and params["name"] in self.URL_ATTRIBUTES:
+            return urljoin(self._current_url, value)
+        return value
+
+    @property
+    def page_source(self) -> str:
+        return self.execute("getPageSource")
+
+    @property
+    def current_url(self) -> str:
+        return self.execute("getCurrentUrl")
+
+    def find_elements(self, by: str, value: str) -> List[ReplayElement]:
+        return self.execute("findElements", {"using": by, "value": value})
+
+    def find_element(self, by: str, value: str) -> ReplayElement:
+        elements = self.find_elements(by, value)
+        if not elements:
+            from selenium.common.exceptions import NoSuchElementException
+            raise NoSuchElementException(f"No element matches {by}: {value}")
+        return elements[0]
+
+    def execute_script(self, script: str, *args):
+        return self.execute("executeScript", {"script": script, "args": args})
+
+    def quit(self) -> None:
+        self.document = None
+
+@dataclass
+class ReplayedPage:
+    page: int
+    recorded_profiles: Optional[int]
+    replayed_profiles: int
+    elapsed: float
+    commands: int
+
+@dataclass
+class ReplayResult:
+    extraction_mode: str
+    profiles: ProfileBatch
+    pages: List[ReplayedPage] = field(default_factory=list)
+
+    @property
+    def elapsed(self) -> float:
+        return sum(page.elapsed for page in self.pages)
+
+    @property
+    def regressions(self) -> List[ReplayedPage]:
+        return [page for page in self.pages
+                if page.recorded_profiles is not None and page.replayed_profiles < page.recorded_profiles]
+
+def replay_recording(recording: Recording, extraction_mode: str = "html", profiles_per_page: int = 10,
+                     metrics: Optional[RunMetrics] = None, quiet: bool = True) -> ReplayResult:
+    if extraction_mode == "batch":
+        print("Batch extraction runs inside the browser, replaying the pages in html mode instead")
+        extraction_mode = "html"
+
+    driver = ReplayDriver()
+    search = LinkedinSearch(
+        driver, extraction_mode=extraction_mode, base_url=recording.base_url or "https://www.linkedin.com",
+        metrics=metrics
+    )
+    result = ReplayResult(extraction_mode, ProfileBatch())
+    sources = {}
+    for recorded in recording.pages:
+        if recorded.sha256 not in sources:
+            sources[recorded.sha256] = recording.read_page(recorded)
+        driver.load(sources[recorded.sha256], recorded.url)
+        search.current_page = recorded.page
+
+        started = time.perf_counter()
+        if quiet:
+            page_profiles = _silently(search._extract_profiles_from_page, profiles_per_page)
+        else:
+            page_profiles = search._extract_profiles_from_page(profiles_per_page)
+        elapsed = time.perf_counter() - started
+
+        result.profiles.extend(page_profiles)
+        result.pages.append(ReplayedPage(
+            recorded.page, recorded.profiles, len(page_profiles), elapsed, search.page_command_counts[-1]
+        ))
+    return result
+
+def _silently(function, *args):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return function(*args)
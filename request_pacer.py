@@ -0,0 +1,108 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, Optional
+import json
+import os
+import threading
+import time
+
+@dataclass
+class PacerConfig:
+    rate: float = 1.0
+    burst: int = 3
+    adaptive: bool = True
+    min_rate: float = 0.1
+    max_rate: float = 2.0
+    increase_step: float = 0.1
+    decrease_factor: float = 0.5
+    slow_response: float = 5.0
+    log_path: Optional[str] = None
+
+class RequestPacer:
+    HEALTHY = "ok"
+    UNHEALTHY_OUTCOMES = ("error", "empty", "slow")
+
+    def __init__(self, config: Optional[PacerConfig] = None):
+        self.config = config or PacerConfig()
+        self.rate = self.config.rate
+        self.max_rate = max(self.config.max_rate, self.config.rate)
+        self.tokens = float(self.config.burst)
+        self.updated = time.monotonic()
+        self.requests = 0
+        self.total_waited = 0.0
+        self.outcomes: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._log_file = None
+        if self.config.log_path:
+            os.makedirs(os.path.dirname(self.config.log_path) or ".", exist_ok=True)
+            self._log_file = open(self.config.log_path, "a")
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.config.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def _log(self, entry: dict) -> None:
+        if not self._log_file:
+            return
+        entry["time"] = datetime.now().isoformat(timespec="milliseconds")
+        self._log_file.write(json.dumps(entry) + "\n")
+        self._log_file.flush()
+
+    def acquire(self, label: str) -> float:
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens -= 1
+            delay = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            self.requests += 1
+            self.total_waited += delay
+            self._log({"event": "acquire", "label": label, "delay": round(delay, 3),
+                       "rate": round(self.rate, 3), "tokens": round(self.tokens, 3)})
+        if delay:
+            time.sleep(delay)
+        return delay
+
+    def record(self, label: str, elapsed: float, outcome: str = HEALTHY) -> None:
+        if outcome == self.HEALTHY and elapsed > self.config.slow_response:
+            outcome = "slow"
+
+        with self._lock:
+            self.outcomes[outcome] = self.outcomes.get(outcome, 0) + 1
+            previous_rate = self.rate
+            decision = "hold"
+            if self.config.adaptive:
+                if outcome in self.UNHEALTHY_OUTCOMES:
+                    self.rate = max(self.config.min_rate, self.rate * self.config.decrease_factor)
+                    decision = "slow_down" if self.rate < previous_rate else "hold"
+                else:
+                    self.rate = min(self.max_rate, self.rate + self.config.increase_step)
+                    decision = "speed_up" if self.rate > previous_rate else "hold"
+            self._log({"event": "response", "label": label, "elapsed": round(elapsed, 3), "outcome": outcome,
+                       "decision": decision, "rate": round(self.rate, 3)})
+
+        if decision == "slow_down":
+            print(f"Pacer: {outcome} response on {label}, slowing down to {self.rate:.2f} requests/sec")
+
+    def navigate(self, label: str, action: Callable[[], None]) -> float:
+        self.acquire(label)
+        started = time.perf_counter()
+        try:
+            action()
+        except Exception:
+            self.record(label, time.perf_counter() - started, "error")
+            raise
+        return time.perf_counter() - started
+
+    def print_summary(self) -> None:
+        if not self.requests:
+            return
+        outcomes = ", ".join(f"{count} {outcome}" for outcome, count in sorted(self.outcomes.items()))
+        print(
+            f"\nRequest pacing: {self.requests} requests, waited {self.total_waited:.2f}s in total, "
+            f"final rate {self.rate:.2f} requests/sec ({outcomes or 'no responses recorded'})"
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._log_file:
+                self._log_file.close()
+                self._log_file = None
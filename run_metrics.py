@@ -0,0 +1,102 @@
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional
+import json
+import os
+import threading
+import time
+
+class RunMetrics:
+    PROMETHEUS_PREFIX = "linkedin_scraper"
+    LATENCY_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+    def __init__(self):
+        self.started_at = datetime.now().isoformat(timespec="seconds")
+        self.started = time.perf_counter()
+        self.counters: Dict[str, float] = {}
+        self.latencies: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, value: float = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def observe(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self.latencies.setdefault(name, []).append(seconds)
+
+    @contextmanager
+    def span(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started)
+
+    @staticmethod
+    def _percentile(ordered: List[float], fraction: float) -> float:
+        return ordered[min(len(ordered) - 1, round(fraction * (len(ordered) - 1)))]
+
+    def report(self) -> dict:
+        with self._lock:
+            latencies = {name: sorted(values) for name, values in self.latencies.items()}
+            counters = dict(self.counters)
+
+        spans = {}
+        for name, values in latencies.items():
+            spans[name] = {
+                "count": len(values),
+                "total": sum(values),
+                "average": sum(values) / len(values),
+                "p50": self._percentile(values, 0.5),
+                "p95": self._percentile(values, 0.95),
+                "max": values[-1]
+            }
+        return {
+            "started_at": self.started_at,
+            "elapsed": time.perf_counter() - self.started,
+            "counters": counters,
+            "spans": spans
+        }
+
+    def prometheus_text(self) -> str:
+        with self._lock:
+            latencies = {name: list(values) for name, values in self.latencies.items()}
+            counters = dict(self.counters)
+
+        lines = []
+        for name, value in sorted(counters.items()):
+            metric = f"{self.PROMETHEUS_PREFIX}_{name}_total"
+            lines += [f"# TYPE {metric} counter", f"{metric} {value}"]
+
+        if latencies:
+            metric = f"{self.PROMETHEUS_PREFIX}_phase_duration_seconds"
+            lines.append(f"# TYPE {metric} histogram")
+            for name, values in sorted(latencies.items()):
+                for bucket in self.LATENCY_BUCKETS:
+                    count = sum(1 for value in values if value <= bucket)
+                    lines.append(f'{metric}_bucket{{phase="{name}",le="{bucket}"}} {count}')
+                lines.append(f'{metric}_bucket{{phase="{name}",le="+Inf"}} {len(values)}')
+                lines.append(f'{metric}_sum{{phase="{name}"}} {sum(values)}')
+                lines.append(f'{metric}_count{{phase="{name}"}} {len(values)}')
+        return "\n".join(lines) + "\n"
+
+    def write(self, report_directory: str = "reports", prometheus_path: Optional[str] = None) -> Optional[str]:
+        try:
+            os.makedirs(report_directory, exist_ok=True)
+            report_path = os.path.join(report_directory, f"run_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.json")
+            with open(report_path, "w") as f:
+                json.dump(self.report(), f, indent=2)
+            print(f"Run report written to {report_path}")
+
+            if prometheus_path:
+                os.makedirs(os.path.dirname(prometheus_path) or ".", exist_ok=True)
+                temporary_path = f"{prometheus_path}.tmp"
+                with open(temporary_path, "w") as f:
+                    f.write(self.prometheus_text())
+                os.replace(temporary_path, prometheus_path)
+                print(f"Prometheus metrics written to {prometheus_path}")
+            return report_path
+        except OSError as e:
+            print(f"Could not write run report: {str(e)}")
+            return None
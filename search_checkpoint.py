@@ -0,0 +1,73 @@
+import hashlib
+import json
+import os
+import re
+import threading
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Optional
+
+CHECKPOINT_DIRECTORY = "checkpoints"
+
+def checkpoint_path(search_term: str, max_profiles: int, directory: str = CHECKPOINT_DIRECTORY) -> str:
+    slug = re.sub(r"[^a-z0-9]+", "_", search_term.lower()).strip("_") or "search"
+    digest = hashlib.sha1(f"{search_term}\0{max_profiles}".encode("utf-8")).hexdigest()[:8]
+    return os.path.join(directory, f"{slug}_{max_profiles}_{digest}.json")
+
+@dataclass
+class SearchCheckpoint:
+    search_term: str
+    max_profiles: int
+    last_completed_page: int = 0
+    profile_count: int = 0
+    exported_rows: int = 0
+    updated_at: str = ""
+    path: str = field(default="", repr=False, compare=False)
+
+    def __post_init__(self):
+        if not self.path:
+            self.path = checkpoint_path(self.search_term, self.max_profiles)
+        self._lock = threading.Lock()
+
+    @property
+    def next_page(self) -> int:
+        return self.last_completed_page + 1
+
+    def record_page(self, page: int, profile_count: int, exported_rows: int = 0) -> None:
+        with self._lock:
+            if page < self.last_completed_page:
+                return
+            self.last_completed_page = page
+            self.profile_count = profile_count
+            self.exported_rows += exported_rows
+            self.save()
+
+    def save(self) -> None:
+        self.updated_at = datetime.now().isoformat(timespec="seconds")
+        data = asdict(self)
+        data.pop("path")
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temporary_path = f"{self.path}.tmp"
+        with open(temporary_path, "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(temporary_path, self.path)
+
+    def clear(self) -> None:
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+def load_checkpoint(search_term: str, max_profiles: int,
+                    directory: str = CHECKPOINT_DIRECTORY) -> Optional[SearchCheckpoint]:
+    path = checkpoint_path(search_term, max_profiles, directory)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+        return SearchCheckpoint(path=path, **data)
+    except (OSError, ValueError, TypeError) as e:
+        print(f"Could not read checkpoint {path}: {str(e)}")
+        return None
@@ -0,0 +1,184 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional, Tuple
+import queue
+import threading
+import time
+from html_profile_parser import HtmlProfileParser
+
+@dataclass
+class PageSnapshot:
+    page_number: int
+    page_source: str
+    page_url: str
+    profiles_to_extract: int
+
+class SearchPipeline:
+    PROFILES_PER_PAGE = 10
+
+    def __init__(self, search, parser_workers: int = 2, queue_size: int = 4):
+        self.search = search
+        self.parser_workers = max(parser_workers, 1)
+        self.queue_size = max(queue_size, 1)
+        self.pages = queue.Queue(maxsize=self.queue_size)
+        self.condition = threading.Condition()
+        self.stopped = False
+        self.pages_in_flight = 0
+        self.profile_count = 0
+        self.browser_blocked = 0.0
+        self.assembler_idle = 0.0
+        self.end_page = None
+        self._local = threading.local()
+
+    def _parser(self) -> HtmlProfileParser:
+        if not hasattr(self._local, "parser"):
+            self._local.parser = HtmlProfileParser(self.search.CARD_FIELDS)
+        return self._local.parser
+
+    def _parse(self, snapshot: PageSnapshot) -> list:
+        return self.search._parse_snapshot(
+            snapshot.page_source, snapshot.page_url, snapshot.profiles_to_extract, parser=self._parser()
+        )
+
+    def _stop(self) -> None:
+        with self.condition:
+            self.stopped = True
+            self.condition.notify_all()
+
+    def _reserve_page(self, max_profiles: int) -> Optional[int]:
+        with self.condition:
+            while not self.stopped:
+                projected = self.profile_count + self.pages_in_flight * self.PROFILES_PER_PAGE
+                if self.search.seen_index is not None or projected < max_profiles:
+                    self.pages_in_flight += 1
+                    if self.search.seen_index is not None:
+                        return self.PROFILES_PER_PAGE
+                    return min(self.PROFILES_PER_PAGE, max_profiles - projected)
+                self.condition.wait()
+            return None
+
+    def _release_page(self, profile_count: Optional[int] = None) -> None:
+        with self.condition:
+            self.pages_in_flight -= 1
+            if profile_count is not None:
+                self.profile_count = profile_count
+            self.condition.notify_all()
+
+    def _put(self, item) -> None:
+        started = time.perf_counter()
+        self.pages.put(item)
+        blocked = time.perf_counter() - started
+        self.browser_blocked += blocked
+        self.search.metrics.observe("pipeline_browser_blocked", blocked)
+
+    def _browse(self, search_term: str, start_page: int, max_profiles: int, executor, cancel_event) -> bool:
+        page_number = start_page
+        while True:
+            if cancel_event and cancel_event.is_set():
+                return True
+            if self.end_page and page_number > self.end_page:
+                print(f"Reached page {self.end_page}, the last page assigned to this search.")
+                return True
+            profiles_to_extract = self._reserve_page(max_profiles)
+            if profiles_to_extract is None:
+                return True
+            if not self.search._load_results_page(search_term, page_number):
+                self._release_page()
+                return False
+
+            self.search.current_page = page_number
+            self.search._scroll_results_into_view(profiles_to_extract)
+            self.search.command_counter.reset()
+            try:
+                with self.search.metrics.span("extraction"):
+                    page_source, page_url = self.search._capture_snapshot()
+            except Exception as e:
+                print(f"Error capturing page source: {str(e)}")
+                page_source, page_url = "", ""
+            self.search._record_page_commands()
+
+            snapshot = PageSnapshot(page_number, page_source, page_url, profiles_to_extract)
+            self._put((snapshot, executor.submit(self._parse, snapshot)))
+            page_number += 1
+
+    def _assemble_page(self, snapshot: PageSnapshot, cards: list, max_profiles: int, sink, checkpoint,
+                       progress_callback, cancel_event) -> int:
+        search = self.search
+        profile_count = self.profile_count
+        print(f"\nScanning page {snapshot.page_number}...")
+        page_profiles = search._build_page_profiles(cards)[:max_profiles - profile_count]
+        search._record_page_metrics(snapshot.page_number, page_profiles)
+        if page_profiles:
+            if not sink:
+                search.profiles.extend(page_profiles)
+            profile_count += len(page_profiles)
+            search.profile_count = profile_count
+            print(f"Found and added {len(page_profiles)} profiles from page {snapshot.page_number}. "
+                  f"Total: {profile_count}")
+        search._record_checkpoint(checkpoint, sink, snapshot.page_number, profile_count, page_profiles)
+        if progress_callback:
+            progress_callback(snapshot.page_number, profile_count, max_profiles)
+
+        if profile_count >= max_profiles:
+            self._stop()
+        elif cancel_event and cancel_event.is_set():
+            print(f"Search cancelled after page {snapshot.page_number}.")
+            search.cancelled = True
+            self._stop()
+        return profile_count
+
+    def _assemble(self, max_profiles: int, sink, checkpoint, progress_callback, cancel_event) -> None:
+        while True:
+            started = time.perf_counter()
+            item = self.pages.get()
+            idle = time.perf_counter() - started
+            self.assembler_idle += idle
+            self.search.metrics.observe("pipeline_assembler_idle", idle)
+            if item is None:
+                return
+
+            snapshot, parse_future = item
+            try:
+                cards = parse_future.result()
+            except Exception as e:
+                print(f"Error parsing page source: {str(e)}")
+                cards = []
+            profile_count = None
+            if not self.stopped:
+                try:
+                    profile_count = self._assemble_page(
+                        snapshot, cards, max_profiles, sink, checkpoint, progress_callback, cancel_event
+                    )
+                except Exception as e:
+                    print(f"Error processing page {snapshot.page_number}: {str(e)}")
+                    self._stop()
+            self._release_page(profile_count)
+
+    def run(self, search_term: str, max_profiles: int, start_page: int, profile_count: int, sink=None,
+            checkpoint=None, progress_callback=None, cancel_event=None, end_page=None) -> Tuple[int, bool]:
+        self.profile_count = profile_count
+        self.end_page = end_page
+        started = time.perf_counter()
+        print(f"Running the search as a pipeline with {self.parser_workers} parser threads "
+              f"and {self.queue_size} queued pages")
+        assembler = threading.Thread(
+            target=self._assemble, args=(max_profiles, sink, checkpoint, progress_callback, cancel_event), daemon=True
+        )
+        assembler.start()
+        with ThreadPoolExecutor(max_workers=self.parser_workers) as executor:
+            try:
+                pages_left = self._browse(search_term, start_page, max_profiles, executor, cancel_event)
+            except Exception as e:
+                print(f"Error in the browser stage: {str(e)}")
+                pages_left = False
+            finally:
+                self.pages.put(None)
+                assembler.join()
+        self.print_summary(time.perf_counter() - started)
+        return self.profile_count, pages_left
+
+    def print_summary(self, elapsed: float) -> None:
+        print(
+            f"\nPipeline: {elapsed:.1f}s total, browser stage blocked {self.browser_blocked:.1f}s on a full queue, "
+            f"assembler waited {self.assembler_idle:.1f}s for parsed pages"
+        )
@@ -0,0 +1,133 @@
+from dataclasses import dataclass
+from typing import Dict, List, Sequence
+import threading
+
+@dataclass(frozen=True)
+class Selector:
+    strategy: str
+    kind: str
+    expression: str
+
+    @property
+    def label(self) -> str:
+        return f"{self.strategy}: {self.expression}"
+
+    def to_script(self) -> dict:
+        return {"kind": self.kind, "expression": self.expression}
+
+def css(expression: str, strategy: str = "css") -> Selector:
+    return Selector(strategy, "css", expression)
+
+def xpath(expression: str, strategy: str = "absolute") -> Selector:
+    return Selector(strategy, "xpath", expression)
+
+class SelectorRegistry:
+    FIND_SCRIPT = """
+        const findAll = (selector, context) => {
+            const root = context || document;
+            if (selector.kind === 'css') {
+                return Array.from(root.querySelectorAll(selector.expression));
+            }
+            const result = document.evaluate(
+                selector.expression, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+            );
+            return Array.from({length: result.snapshotLength}, (_, index) => result.snapshotItem(index));
+        };
+        const findFirst = (selector, context) => {
+            const root = context || document;
+            if (selector.kind === 'css') {
+                return root.querySelector(selector.expression);
+            }
+            return document.evaluate(
+                selector.expression, root, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+            ).singleNodeValue;
+        };
+        const lookup = (chain, context) => {
+            for (let index = 0; index < chain.length; index++) {
+                const node = findFirst(chain[index], context);
+                if (node) {
+                    return [node, index];
+                }
+            }
+            return [null, -1];
+        };
+    """
+    COUNT_SCRIPT = FIND_SCRIPT + """
+        for (const selector of arguments[0]) {
+            const count = findAll(selector).length;
+            if (count) {
+                return count;
+            }
+        }
+        return 0;
+    """
+
+    def __init__(self, chains: Dict[str, Sequence[Selector]], disable_after: int = 25, retry_interval: int = 50):
+        self.chains = {field: list(chain) for field, chain in chains.items()}
+        self.disable_after = disable_after
+        self.retry_interval = retry_interval
+        self.preferred: Dict[str, Selector] = {}
+        self.hits: Dict[Selector, int] = {}
+        self.misses: Dict[Selector, int] = {}
+        self.consecutive_misses: Dict[Selector, int] = {}
+        self.lookups: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _disabled(self, selector: Selector) -> bool:
+        return self.consecutive_misses.get(selector, 0) >= self.disable_after
+
+    def _ordered(self, field: str, probe: bool) -> List[Selector]:
+        preferred = self.preferred.get(field)
+        ordered = [preferred] if preferred else []
+        ordered += [selector for selector in self.chains[field]
+                    if selector != preferred and (probe or not self._disabled(selector))]
+        return ordered or list(self.chains[field])
+
+    def ordered(self, field: str) -> List[Selector]:
+        with self._lock:
+            return self._ordered(field, probe=False)
+
+    def chain(self, field: str) -> List[Selector]:
+        with self._lock:
+            lookups = self.lookups[field] = self.lookups.get(field, 0) + 1
+            return self._ordered(field, probe=lookups % self.retry_interval == 0)
+
+    def record(self, field: str, tried: Sequence[Selector], hit_index: int, count: int = 1) -> int:
+        missed = tried if hit_index < 0 else tried[:hit_index]
+        with self._lock:
+            for selector in missed:
+                self.misses[selector] = self.misses.get(selector, 0) + count
+                self.consecutive_misses[selector] = self.consecutive_misses.get(selector, 0) + count
+            if hit_index >= 0:
+                winner = tried[hit_index]
+                self.hits[winner] = self.hits.get(winner, 0) + count
+                self.consecutive_misses[winner] = 0
+                if self.preferred.get(field) != winner:
+                    self.preferred[field] = winner
+                    print(f"Selector for {field} switched to {winner.label}")
+        return len(missed) * count
+
+    def summary(self) -> Dict[str, List[dict]]:
+        with self._lock:
+            return {
+                field: [
+                    {
+                        "selector": selector.label,
+                        "hits": self.hits.get(selector, 0),
+                        "misses": self.misses.get(selector, 0),
+                        "preferred": self.preferred.get(field) == selector,
+                        "disabled": self._disabled(selector)
+                    }
+                    for selector in chain
+                ]
+                for field, chain in self.chains.items()
+            }
+
+    def print_summary(self) -> None:
+        print("\nSelector statistics:")
+        for field, selectors in self.summary().items():
+            for stats in selectors:
+                if not stats["hits"] and not stats["misses"]:
+                    continue
+                marker = "*" if stats["preferred"] else ("-" if stats["disabled"] else " ")
+                print(f"  {marker} {field}: {stats['hits']} hits, {stats['misses']} misses - {stats['selector']}")
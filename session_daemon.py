@@ -0,0 +1,168 @@
+from dataclasses import replace
+from pathlib import Path
+from typing import List, Optional
+import os
+import secrets
+import sys
+import time
+
+DAEMON_HOST = "127.0.0.1"
+DAEMON_PORT = 47821
+DAEMON_KEY_FILE = os.path.join("cookies", "session_daemon.key")
+DAEMON_CONNECT_TIMEOUT = 2.0
+JOB_FIELDS = ("search_term", "max_profiles", "extraction_mode", "resume", "ignore_seen_index", "enrich_tabs", "parser_workers", "render_excel")
+
+def _load_authkey(create: bool = False) -> Optional[bytes]:
+    key_path = Path(DAEMON_KEY_FILE)
+    if key_path.exists():
+        return key_path.read_bytes()
+    if not create:
+        return None
+
+    key_path.parent.mkdir(exist_ok=True)
+    authkey = secrets.token_hex(32).encode("ascii")
+    key_path.write_bytes(authkey)
+    os.chmod(key_path, 0o600)
+    return authkey
+
+def _connect(port: int, authkey: bytes):
+    import socket
+    from multiprocessing.connection import Connection, answer_challenge, deliver_challenge
+
+    sock = socket.create_connection((DAEMON_HOST, port), timeout=DAEMON_CONNECT_TIMEOUT)
+    sock.setblocking(True)
+    connection = Connection(sock.detach())
+    try:
+        if not connection.poll(DAEMON_CONNECT_TIMEOUT):
+            raise TimeoutError("Session daemon did not answer, it is probably busy with another job")
+        answer_challenge(connection, authkey)
+        deliver_challenge(connection, authkey)
+    except BaseException:
+        connection.close()
+        raise
+    return connection
+
+def _request(message: dict, port: int = DAEMON_PORT, timeout: Optional[float] = None) -> Optional[dict]:
+    from multiprocessing import AuthenticationError
+
+    authkey = _load_authkey()
+    if not authkey:
+        return None
+
+    try:
+        with _connect(port, authkey) as connection:
+            connection.send(message)
+            if timeout is not None and not connection.poll(timeout):
+                return None
+            return connection.recv()
+    except (ConnectionRefusedError, EOFError, OSError, AuthenticationError):
+        return None
+
+def daemon_available(port: int = DAEMON_PORT) -> bool:
+    response = _request({"action": "ping"}, port, timeout=DAEMON_CONNECT_TIMEOUT)
+    return bool(response and response.get("status") == "ok")
+
+def unsupported_job_options(config) -> List[str]:
+    from dataclasses import fields
+    from main import ArgumentValidator
+
+    flags = {field: flag for flag, (field, _) in ArgumentValidator.OPTIONS.items()}
+    return [
+        flags.get(item.name, item.name) for item in fields(config)
+        if item.name not in JOB_FIELDS + ("no_daemon",) and getattr(config, item.name) != item.default
+    ]
+
+def submit_job(config, port: int = DAEMON_PORT) -> Optional[dict]:
+    job = {field: getattr(config, field) for field in JOB_FIELDS}
+    job["action"] = "search"
+    return _request(job, port)
+
+def shutdown_daemon(port: int = DAEMON_PORT) -> bool:
+    return _request({"action": "shutdown"}, port) is not None
+
+class SessionDaemon:
+    def __init__(self, base_config, port: int = DAEMON_PORT):
+        self.base_config = base_config
+        self.port = port
+        self.scraper = None
+        self.jobs_completed = 0
+
+    def _start_session(self) -> None:
+        from main import LinkedinScraper
+
+        self.scraper = LinkedinScraper(self.base_config)
+        self.scraper.initialize_browser()
+        if not self.scraper.login(self.scraper.create_waiter()):
+            raise RuntimeError("Login failed! Please check your credentials.")
+        print("Browser session is logged in and ready for jobs.")
+
+    def _run_job(self, job: dict) -> dict:
+        self.scraper.config = replace(self.base_config, **{field: job[field] for field in JOB_FIELDS if field in job})
+        started = time.perf_counter()
+        excel_file = self.scraper.run_scraping_with_relogin()
+        self.jobs_completed += 1
+        return {
+            "status": "ok",
+            "profiles": self.scraper.profile_count,
+            "excel_file": excel_file,
+            "elapsed": time.perf_counter() - started
+        }
+
+    def _handle(self, message: dict) -> dict:
+        action = message.get("action")
+        if action == "ping":
+            return {"status": "ok", "jobs_completed": self.jobs_completed}
+        if action == "search":
+            try:
+                return self._run_job(message)
+            except Exception as e:
+                return {"status": "error", "error": str(e)}
+        if action == "shutdown":
+            return {"status": "ok"}
+        return {"status": "error", "error": f"Unknown action: {action}"}
+
+    def serve_forever(self) -> None:
+        from multiprocessing import AuthenticationError
+        from multiprocessing.connection import Listener
+
+        authkey = _load_authkey(create=True)
+        self._start_session()
+        try:
+            with Listener((DAEMON_HOST, self.port), authkey=authkey) as listener:
+                print(f"Session daemon listening on {DAEMON_HOST}:{self.port}")
+                while True:
+                    try:
+                        with listener.accept() as connection:
+                            message = connection.recv()
+                            print(f"\nReceived job: {message}")
+                            connection.send(self._handle(message))
+                            if message.get("action") == "shutdown":
+                                break
+                    except AuthenticationError as e:
+                        print(f"Rejected a client with the wrong session key: {str(e)}")
+                    except (EOFError, OSError) as e:
+                        print(f"Connection error: {str(e)}")
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if self.scraper:
+                self.scraper.close()
+
+def main():
+    from main import ArgumentValidator, ScrapingConfig
+
+    port = DAEMON_PORT
+    args = sys.argv[1:]
+    if "--stop" in args:
+        print("Session daemon stopped." if shutdown_daemon(port) else "Session daemon is not running.")
+        return
+
+    validator = ArgumentValidator()
+    positionals, options = validator._split_options(args)
+    if positionals:
+        raise SystemExit("Usage: python session_daemon.py [--lean] [--base-url URL] [--extraction-mode MODE] | --stop")
+    validator._validate_options(options)
+    SessionDaemon(ScrapingConfig(search_term="", max_profiles=1, **options), port).serve_forever()
+
+if __name__ == "__main__":
+    main()
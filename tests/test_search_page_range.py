@@ -0,0 +1,42 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from fixtures import render_results_page, sample_profiles
+from page_backend import ReplayBackend
+from page_recorder import PageRecorder
+from request_pacer import PacerConfig, RequestPacer
+
+BASE_URL = "https://www.linkedin.com"
+SEARCH_TERM = "engineer"
+
+@pytest.fixture
+def recording(tmp_path):
+    recorder = PageRecorder(str(tmp_path / "recordings"), search_term=SEARCH_TERM, base_url=BASE_URL,
+                            extraction_mode="html")
+    for page in range(1, 6):
+        page_url = f"{BASE_URL}/search/results/people/?keywords={SEARCH_TERM}&page={page}"
+        recorder.record(page, render_results_page(sample_profiles(10, page), page, has_next=page < 5), page_url)
+    return recorder.recording
+
+@pytest.mark.parametrize("parser_workers", [0, 2])
+def test_search_stops_at_end_page(recording, capsys, parser_workers):
+    pytest.importorskip("lxml")
+    from linkedin_profile_search import LinkedinSearch
+
+    search = LinkedinSearch(
+        extraction_mode="html", base_url=BASE_URL, backend=ReplayBackend(recording), parser_workers=parser_workers,
+        pacer=RequestPacer(PacerConfig(rate=1000.0, burst=100, adaptive=False))
+    )
+    profiles = search.search_profiles(SEARCH_TERM, 100, start_page=2, end_page=3)
+    output = capsys.readouterr().out
+
+    assert len(profiles) == 20
+    assert output.count("Scanning page") == 2
+    assert "Scanning page 2" in output and "Scanning page 3" in output
+    assert "No more pages available" not in output
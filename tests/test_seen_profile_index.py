@@ -0,0 +1,59 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from fixtures import render_results_page, sample_profiles
+from page_backend import ReplayBackend
+from page_recorder import PageRecorder
+from profile_index import SeenProfileIndex
+from request_pacer import PacerConfig, RequestPacer
+
+BASE_URL = "https://www.linkedin.com"
+SEARCH_TERM = "engineer"
+
+@pytest.fixture
+def recording(tmp_path):
+    recorder = PageRecorder(str(tmp_path / "recordings"), search_term=SEARCH_TERM, base_url=BASE_URL,
+                            extraction_mode="html")
+    for page in range(1, 4):
+        page_url = f"{BASE_URL}/search/results/people/?keywords={SEARCH_TERM}&page={page}"
+        recorder.record(page, render_results_page(sample_profiles(10, page), page, has_next=page < 3), page_url)
+    return recorder.recording
+
+def run_search(recording, seen_index, max_profiles=10):
+    from linkedin_profile_search import LinkedinSearch
+
+    search = LinkedinSearch(
+        extraction_mode="html", base_url=BASE_URL, seen_index=seen_index, backend=ReplayBackend(recording),
+        pacer=RequestPacer(PacerConfig(rate=1000.0, burst=100, adaptive=False))
+    )
+    return search.search_profiles(SEARCH_TERM, max_profiles)
+
+def test_empty_index_is_still_an_index(tmp_path):
+    index = SeenProfileIndex(str(tmp_path / "seen.sqlite3"))
+    assert index
+    index.close()
+
+def test_exported_profiles_are_skipped_by_the_next_search(tmp_path, recording):
+    for module in ("lxml", "pandas", "openpyxl"):
+        pytest.importorskip(module)
+    from excel_creator import ExcelCreator
+
+    index = SeenProfileIndex(str(tmp_path / "seen.sqlite3"))
+    creator = ExcelCreator(output_directory=str(tmp_path / "exports"), seen_index=index)
+
+    first = run_search(recording, index)
+    assert len(first) == 10
+    assert creator.export_profiles(first, SEARCH_TERM)
+    assert all(index.contains_profile(profile) for profile in first)
+    assert creator.export_profiles(first, SEARCH_TERM) is None
+
+    second = run_search(recording, index)
+    assert len(second) == 10
+    assert not {profile.profile_link for profile in first} & {profile.profile_link for profile in second}
+    index.close()